@@ -41,6 +41,16 @@ class BrailleDot(IntFlag):
 BRAILLE_BASE = 0x2800
 
 
+class _CellTable(dict):
+    """
+    str.translate table for encoding: codepoints < 256 are filled in up
+    front, anything above wraps onto the cell for code % 256.
+    """
+    
+    def __missing__(self, code: int) -> str:
+        return chr(BRAILLE_BASE + code % 256)
+
+
 @dataclass
 class Braille8Cell:
     """A single 8-dot braille cell"""
@@ -122,6 +132,10 @@ class Braille8Encoder:
     # Reverse mapping for decoding
     DOT8_TO_ASCII: Dict[int, int] = {v: k for k, v in ASCII_TO_8DOT.items()}
     
+    # str.translate tables, built from the completed mappings
+    _encode_table: Optional[_CellTable] = None
+    _decode_table: Optional[Dict[int, str]] = None
+    
     def __init__(self):
         # Build complete mapping for all ASCII
         self._complete_mapping()
@@ -136,6 +150,16 @@ class Braille8Encoder:
         # Update reverse mapping
         self.DOT8_TO_ASCII = {v: k for k, v in self.ASCII_TO_8DOT.items()}
         
+        # The mappings are class-level, so the tables are built only once
+        if Braille8Encoder._encode_table is None:
+            Braille8Encoder._encode_table = _CellTable(
+                (code, chr(BRAILLE_BASE + self.ASCII_TO_8DOT[code])) for code in range(256)
+            )
+            Braille8Encoder._decode_table = {
+                BRAILLE_BASE + dots: chr(self.DOT8_TO_ASCII.get(dots, dots))
+                for dots in range(256)
+            }
+        
     def encode_char(self, char: str) -> Braille8Cell:
         """Encode a single character to 8-dot braille"""
         code = ord(char)
@@ -148,11 +172,21 @@ class Braille8Encoder:
         
     def encode(self, text: str) -> str:
         """Encode text to 8-dot braille string"""
-        result = []
-        for char in text:
-            cell = self.encode_char(char)
-            result.append(cell.unicode)
-        return ''.join(result)
+        # Same mapping as encode_char, applied by str.translate in C
+        return text.translate(self._encode_table)
+        
+    def encode_batch(self, texts: List[str]) -> List[str]:
+        """Encode several strings with a single translate pass"""
+        # encode gives one cell per character, so the joined result splits
+        # back on the original lengths
+        braille = self.encode(''.join(texts))
+        encoded = []
+        pos = 0
+        for text in texts:
+            end = pos + len(text)
+            encoded.append(braille[pos:end])
+            pos = end
+        return encoded
         
     def encode_to_cells(self, text: str) -> List[Braille8Cell]:
         """Encode text to list of braille cells"""
@@ -170,10 +204,20 @@ class Braille8Encoder:
         
     def decode(self, braille: str) -> str:
         """Decode 8-dot braille string to text"""
-        result = []
-        for char in braille:
-            result.append(self.decode_char(char))
-        return ''.join(result)
+        # Same mapping as decode_char; non-braille characters pass through
+        return braille.translate(self._decode_table)
+        
+    # Joins decode_batch inputs; a noncharacter, neither braille nor
+    # produced by decoding
+    _BATCH_SEP = '\uffff'
+    
+    def decode_batch(self, braille_strings: List[str]) -> List[str]:
+        """Decode several braille strings with a single translate pass"""
+        if any(self._BATCH_SEP in b for b in braille_strings):
+            return [self.decode(b) for b in braille_strings]
+        if not braille_strings:
+            return []
+        return self.decode(self._BATCH_SEP.join(braille_strings)).split(self._BATCH_SEP)
         
     def is_braille(self, text: str) -> bool:
         """Check if text is 8-dot braille"""
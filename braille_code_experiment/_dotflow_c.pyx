@@ -0,0 +1,63 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled bit-diff kernels for Temporal Dot-Flow
+===============================================
+
+Optional accelerator for dot_flow.py. When this extension is not built,
+dot_flow.py falls back to equivalent NumPy kernels, so nothing here is
+required at runtime.
+
+Build in place with:
+
+    cythonize -i _dotflow_c.pyx
+
+Author: Ryan Barrett
+"""
+
+import numpy as np
+
+cdef extern from *:
+    int __builtin_popcount(unsigned int) nogil
+
+
+def transitions(const unsigned char[::1] m):
+    """
+    Dot changes between adjacent 8-dot masks.
+
+    Returns (appeared, disappeared, persisted, energy_delta) arrays of
+    length len(m) - 1.
+    """
+    cdef Py_ssize_t n = m.shape[0] - 1 if m.shape[0] > 1 else 0
+    cdef Py_ssize_t i
+
+    app_arr = np.empty(n, dtype=np.uint8)
+    dis_arr = np.empty(n, dtype=np.uint8)
+    per_arr = np.empty(n, dtype=np.uint8)
+    de_arr = np.empty(n, dtype=np.int8)
+
+    cdef unsigned char[::1] app = app_arr
+    cdef unsigned char[::1] dis = dis_arr
+    cdef unsigned char[::1] per = per_arr
+    cdef signed char[::1] de = de_arr
+
+    with nogil:
+        for i in range(n):
+            app[i] = m[i + 1] & ~m[i]
+            dis[i] = m[i] & ~m[i + 1]
+            per[i] = m[i] & m[i + 1]
+            de[i] = __builtin_popcount(m[i + 1]) - __builtin_popcount(m[i])
+
+    return app_arr, dis_arr, per_arr, de_arr
+
+
+def hamming(const unsigned char[::1] a, const unsigned char[::1] b):
+    """Total differing dots between two equal-length mask arrays."""
+    cdef Py_ssize_t n = min(a.shape[0], b.shape[0])
+    cdef Py_ssize_t i
+    cdef long total = 0
+
+    with nogil:
+        for i in range(n):
+            total += __builtin_popcount(a[i] ^ b[i])
+
+    return total
@@ -293,7 +293,7 @@ class DotFlowBenchmark:
         # Storage sizes
         raw_audio_size = len(samples) * 2  # 16-bit samples
         waveform_size = len(fp.waveform.encode('utf-8'))
-        flow_seq_size = len(flow_sig.flow_sequence.encode('utf-8'))
+        flow_seq_size = len(flow_sig.flow_sequence)
         
         # Typical deep learning embedding size
         dl_embedding_size = 512 * 4  # 512 float32 values
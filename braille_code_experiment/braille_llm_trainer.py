@@ -369,7 +369,7 @@ def train_braille_lm(epochs: int = 100, batch_size: int = 32):
     from dot_flow import TemporalDotFlow
     flow = TemporalDotFlow()
     sig = flow.encode(output)
-    print(f"   Flow:      {sig.flow_sequence}")
+    print(f"   Flow:      {flow.flow_symbols(sig.flow_sequence)}")
     print(f"   Dominant:  {sig.dominant_flow.name}")
     
     print("\n✅ Training complete!")
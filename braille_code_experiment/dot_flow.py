@@ -23,12 +23,79 @@ Author: Ryan Barrett
 """
 
 import math
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Tuple, Optional, Dict, Set
 from enum import Enum, auto
 
+import numpy as np
+
 from octo_bresenham import OctoBresenham
 
+# Optional compiled bit-diff kernels (see _dotflow_c.pyx)
+try:
+    import _dotflow_c
+except ImportError:
+    _dotflow_c = None
+
+
+# Energy contours are compared at (at most) this many points
+CONTOUR_LEN = 20
+
+BRAILLE_BASE = 0x2800
+
+# Number of raised dots for every 8-dot mask
+POPCOUNT = np.array([bin(m).count('1') for m in range(256)], dtype=np.uint8)
+
+
+def braille_to_masks(braille_string: str) -> np.ndarray:
+    """Convert a Braille string to its 8-dot masks (non-Braille -> 0)."""
+    cp = np.frombuffer(braille_string.encode('utf-32-le'), dtype=np.uint32)
+    return np.where(cp >= BRAILLE_BASE, cp - BRAILLE_BASE, 0).astype(np.uint8)
+
+
+def _transitions_np(m: np.ndarray):
+    """NumPy fallback for _dotflow_c.transitions."""
+    a, b = m[:-1], m[1:]
+    energy_delta = POPCOUNT[b].astype(np.int8) - POPCOUNT[a].astype(np.int8)
+    return b & ~a, a & ~b, a & b, energy_delta
+
+
+def _hamming_np(a: np.ndarray, b: np.ndarray) -> int:
+    """NumPy fallback for _dotflow_c.hamming."""
+    return int(POPCOUNT[a ^ b].sum(dtype=np.int64))
+
+
+if _dotflow_c is not None:
+    dot_transitions = _dotflow_c.transitions
+    dot_hamming = _dotflow_c.hamming
+else:
+    dot_transitions = _transitions_np
+    dot_hamming = _hamming_np
+
+
+def _normalize_contour(contour: List[float], length: int) -> Optional[np.ndarray]:
+    """
+    Resample a contour to `length` points and make it zero-mean/unit-norm.
+    
+    The dot product of two such vectors is their Pearson correlation.
+    Returns None when the contour is empty or flat (correlation undefined).
+    """
+    if not contour or length <= 0:
+        return None
+    
+    c = np.asarray(contour, dtype=np.float64)
+    if len(c) != length:
+        # Float division, as in int((i / length) * len(contour)); exact
+        # integer division picks a later point for some lengths
+        idx = (np.arange(length) / length * len(c)).astype(np.intp)
+        c = c[np.minimum(idx, len(c) - 1)]
+    
+    c = c - c.mean()
+    norm = np.linalg.norm(c)
+    if norm == 0:
+        return None
+    return c / norm
+
 
 class FlowDirection(Enum):
     """Direction of dot movement between characters."""
@@ -56,10 +123,18 @@ class FlowSignature:
     """A complete flow-based fingerprint."""
     source: str                      # Original Braille string
     transitions: List[DotTransition]
-    flow_sequence: str               # Encoded as symbols: ↑↓○●◐◑
+    flow_sequence: bytes             # One FlowDirection value per transition
     rhythm_pattern: str              # Encoded pulse timing
     energy_contour: List[float]      # Dot density over time
     dominant_flow: FlowDirection
+    energy_norm: Optional[np.ndarray] = field(
+        default=None, init=False, repr=False, compare=False
+    )                                # Cached normalized contour
+    
+    def __post_init__(self):
+        self.energy_norm = _normalize_contour(
+            self.energy_contour, min(len(self.energy_contour), CONTOUR_LEN)
+        )
 
 
 class TemporalDotFlow:
@@ -90,8 +165,25 @@ class TemporalDotFlow:
         FlowDirection.PULSE: '◐',
     }
     
+    # str.translate table: FlowDirection value -> display symbol
+    _FLOW_TO_CHAR = {d.value: sym for d, sym in FLOW_SYMBOLS.items()}
+    
+    # str.translate table: display symbol -> FlowDirection value
+    _CHAR_TO_FLOW = {ord(sym): d.value for d, sym in FLOW_SYMBOLS.items()}
+    
+    # str.translate table: rhythm code -> display symbol
+    _RHYTHM_TO_CHAR = {0: '○', 1: '◐', 2: '●'}
+    
     def __init__(self):
         self.bresenham = OctoBresenham()
+        
+        # Per-mask lookup tables so encode() works on whole mask arrays
+        mask_dots = [self._char_to_dots(chr(self.BRAILLE_BASE + m)) for m in range(256)]
+        centroids = [self._compute_centroid(dots) for dots in mask_dots]
+        self._mask_dots = [frozenset(dots) for dots in mask_dots]
+        self._centroid_x = np.array([c[0] for c in centroids])
+        self._centroid_y = np.array([c[1] for c in centroids])
+        self._spread = np.array([self._compute_spread(dots) for dots in mask_dots])
     
     def _char_to_dots(self, char: str) -> Set[Tuple[int, int]]:
         """Convert Braille character to set of active dot positions."""
@@ -198,52 +290,78 @@ class TemporalDotFlow:
             return FlowSignature(
                 source=braille_string,
                 transitions=[],
-                flow_sequence="",
+                flow_sequence=b"",
                 rhythm_pattern="",
                 energy_contour=[],
                 dominant_flow=FlowDirection.STABLE
             )
         
-        transitions = []
-        flow_sequence = []
-        energy_contour = []
-        
-        # Compute all transitions
-        for i in range(len(braille_string) - 1):
-            trans = self.compute_transition(braille_string[i], braille_string[i + 1])
-            transitions.append(trans)
-            flow_sequence.append(self.FLOW_SYMBOLS[trans.flow_direction])
-            
-            # Track energy
-            dots = self._char_to_dots(braille_string[i])
-            energy_contour.append(len(dots) / 8.0)  # Normalize to 0-1
+        masks = braille_to_masks(braille_string)
+        appeared, disappeared, persisted, energy_delta = dot_transitions(masks)
+        appeared = np.asarray(appeared)
+        disappeared = np.asarray(disappeared)
+        energy_delta = np.asarray(energy_delta)
+        
+        # Flow direction per transition, same rules as _determine_flow_direction
+        n_appeared = POPCOUNT[appeared]
+        spread_app = self._spread[appeared]
+        spread_dis = self._spread[disappeared]
+        dx = self._centroid_x[masks[1:]] - self._centroid_x[masks[:-1]]
+        dy = self._centroid_y[masks[1:]] - self._centroid_y[masks[:-1]]
+        
+        directions = np.select(
+            [
+                (n_appeared > 0) & (n_appeared == POPCOUNT[disappeared]),
+                spread_app > spread_dis + 0.5,
+                spread_dis > spread_app + 0.5,
+                dy < -0.3,
+                dy > 0.3,
+            ],
+            [
+                FlowDirection.PULSE.value,
+                FlowDirection.EXPAND.value,
+                FlowDirection.CONTRACT.value,
+                FlowDirection.UP.value,
+                FlowDirection.DOWN.value,
+            ],
+            default=FlowDirection.STABLE.value,
+        ).astype(np.uint8)
+        
+        mask_dots = self._mask_dots
+        transitions = [
+            DotTransition(
+                appeared=mask_dots[a],
+                disappeared=mask_dots[d],
+                persisted=mask_dots[p],
+                flow_direction=FlowDirection(f),
+                energy_delta=e,
+                centroid_shift=(sx, sy)
+            )
+            for a, d, p, f, e, sx, sy in zip(
+                appeared.tolist(), disappeared.tolist(),
+                np.asarray(persisted).tolist(), directions.tolist(),
+                energy_delta.tolist(), dx.tolist(), dy.tolist()
+            )
+        ]
         
-        # Add final character's energy
-        final_dots = self._char_to_dots(braille_string[-1])
-        energy_contour.append(len(final_dots) / 8.0)
+        # Energy: dot density per character, normalized to 0-1
+        energy_contour = (POPCOUNT[masks] / 8.0).tolist()
         
         # Compute rhythm pattern (where pulses occur)
-        rhythm = []
-        for trans in transitions:
-            if trans.flow_direction == FlowDirection.PULSE:
-                rhythm.append('●')
-            elif abs(trans.energy_delta) > 2:
-                rhythm.append('◐')
-            else:
-                rhythm.append('○')
-        
-        # Determine dominant flow
-        flow_counts = {}
-        for trans in transitions:
-            flow_counts[trans.flow_direction] = flow_counts.get(trans.flow_direction, 0) + 1
-        
-        dominant_flow = max(flow_counts.keys(), key=lambda k: flow_counts[k]) if flow_counts else FlowDirection.STABLE
+        rhythm = np.where(
+            directions == FlowDirection.PULSE.value, 2,
+            np.where(np.abs(energy_delta) > 2, 1, 0)
+        ).astype(np.uint8)
+        
+        # Determine dominant flow (ties go to the lowest FlowDirection value)
+        counts = np.bincount(directions, minlength=len(FlowDirection) + 1)
+        dominant_flow = FlowDirection(int(counts.argmax()))
         
         return FlowSignature(
             source=braille_string,
             transitions=transitions,
-            flow_sequence=''.join(flow_sequence),
-            rhythm_pattern=''.join(rhythm),
+            flow_sequence=directions.tobytes(),
+            rhythm_pattern=rhythm.tobytes().decode('latin-1').translate(self._RHYTHM_TO_CHAR),
             energy_contour=energy_contour,
             dominant_flow=dominant_flow
         )
@@ -270,7 +388,7 @@ class TemporalDotFlow:
         rhythm_sim = self._sequence_similarity(sig1.rhythm_pattern, sig2.rhythm_pattern)
         
         # 3. Energy contour correlation
-        energy_sim = self._contour_similarity(sig1.energy_contour, sig2.energy_contour)
+        energy_sim = self._contour_similarity(sig1, sig2)
         
         # 4. Dominant flow match bonus
         flow_bonus = 0.1 if sig1.dominant_flow == sig2.dominant_flow else 0.0
@@ -283,7 +401,15 @@ class TemporalDotFlow:
             flow_bonus
         ))
     
-    def _sequence_similarity(self, seq1: str, seq2: str) -> float:
+    def flow_symbols(self, flow_sequence: bytes) -> str:
+        """Render a stored flow sequence as its display symbols (↑↓◇◆─◐)."""
+        return flow_sequence.decode('latin-1').translate(self._FLOW_TO_CHAR)
+    
+    def flow_bytes(self, symbols: str) -> bytes:
+        """Inverse of flow_symbols: parse display symbols back to a flow sequence."""
+        return symbols.translate(self._CHAR_TO_FLOW).encode('latin-1')
+    
+    def _sequence_similarity(self, seq1, seq2) -> float:
         """Compute similarity between two symbol sequences using LCS."""
         if not seq1 or not seq2:
             return 0.0
@@ -302,38 +428,21 @@ class TemporalDotFlow:
         lcs_length = dp[m][n]
         return (2 * lcs_length) / (m + n)
     
-    def _contour_similarity(self, c1: List[float], c2: List[float]) -> float:
+    def _contour_similarity(self, sig1: FlowSignature, sig2: FlowSignature) -> float:
         """Compute similarity between energy contours using correlation."""
-        if not c1 or not c2:
+        a, b = sig1.energy_norm, sig2.energy_norm
+        if a is None or b is None:
             return 0.0
         
-        # Resample to same length
-        target_len = min(len(c1), len(c2), 20)
-        
-        def resample(contour, length):
-            if len(contour) == length:
-                return contour
-            result = []
-            for i in range(length):
-                idx = int((i / length) * len(contour))
-                result.append(contour[min(idx, len(contour) - 1)])
-            return result
-        
-        c1_r = resample(c1, target_len)
-        c2_r = resample(c2, target_len)
-        
-        # Pearson correlation
-        mean1 = sum(c1_r) / len(c1_r)
-        mean2 = sum(c2_r) / len(c2_r)
-        
-        numerator = sum((a - mean1) * (b - mean2) for a, b in zip(c1_r, c2_r))
-        denom1 = math.sqrt(sum((a - mean1) ** 2 for a in c1_r))
-        denom2 = math.sqrt(sum((b - mean2) ** 2 for b in c2_r))
-        
-        if denom1 == 0 or denom2 == 0:
-            return 0.0
+        # Short contours: re-normalize both at the shorter length
+        if len(a) != len(b):
+            target_len = min(len(a), len(b))
+            a = _normalize_contour(sig1.energy_contour, target_len)
+            b = _normalize_contour(sig2.energy_contour, target_len)
+            if a is None or b is None:
+                return 0.0
         
-        correlation = numerator / (denom1 * denom2)
+        correlation = float(a @ b)
         return (correlation + 1) / 2  # Normalize to 0-1
     
     def visualize_flow(self, sig: FlowSignature) -> str:
@@ -343,7 +452,7 @@ class TemporalDotFlow:
             "│ TEMPORAL DOT-FLOW SIGNATURE                         │",
             "├─────────────────────────────────────────────────────┤",
             f"│ Source:   {sig.source[:40]:<40} │",
-            f"│ Flow:     {sig.flow_sequence[:40]:<40} │",
+            f"│ Flow:     {self.flow_symbols(sig.flow_sequence[:40]):<40} │",
             f"│ Rhythm:   {sig.rhythm_pattern[:40]:<40} │",
             f"│ Dominant: {sig.dominant_flow.name:<40} │",
             "├─────────────────────────────────────────────────────┤",
@@ -432,8 +541,8 @@ def demo():
     print(f"\nPattern 1: {pattern1}")
     print(f"Pattern 2: {pattern2}")
     print(f"\nThese look different, but...")
-    print(f"Flow 1:    {sig1.flow_sequence}")
-    print(f"Flow 2:    {sig2.flow_sequence}")
+    print(f"Flow 1:    {flow.flow_symbols(sig1.flow_sequence)}")
+    print(f"Flow 2:    {flow.flow_symbols(sig2.flow_sequence)}")
     print(f"\nFlow similarity: {flow.flow_similarity(sig1, sig2):.2f}")
     print("\n✨ Same 'feel' despite different dots!")
 
@@ -12,18 +12,41 @@ genuinely novel audio fingerprint matching.
 Author: Ryan Barrett
 """
 
+import math
 import os
 import sqlite3
-import struct
 import wave
+import zlib
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from itertools import repeat
+from typing import List, Optional, Dict, Any, BinaryIO
 
-from dot_flow import TemporalDotFlow, FlowSignature, FlowDirection
+import numpy as np
+
+from dot_flow import (
+    TemporalDotFlow, FlowSignature, FlowDirection, braille_to_masks, dot_hamming,
+    CONTOUR_LEN, _normalize_contour
+)
 from audio_fingerprint import AudioFingerprintGenerator
 from octo_bresenham import OctoBresenham
 
+# Optional approximate nearest-neighbour backend for large indexes
+try:
+    import faiss
+    HAS_FAISS = True
+except ImportError:
+    HAS_FAISS = False
+
+
+# PCM sample width -> (dtype, full scale, offset); 8-bit WAV is unsigned
+_PCM_FORMATS = {
+    1: (np.uint8, 128.0, 128),
+    2: (np.dtype('<i2'), 32768.0, 0),
+    4: (np.dtype('<i4'), 2147483648.0, 0),
+}
+
 
 @dataclass
 class FlowSearchResult:
@@ -40,6 +63,38 @@ class FlowSearchResult:
     youtube_url: str
 
 
+def _encode_chunk_with(generator: AudioFingerprintGenerator, flow: TemporalDotFlow,
+                       chunk: List[float], sample_rate: int) -> tuple:
+    """Fingerprint + flow-encode one chunk into the fields stored per row."""
+    chunk_fp = generator.from_samples(chunk, sample_rate)
+    
+    # Encode as flow signature (THE NOVEL PART)
+    flow_sig = flow.encode(chunk_fp.waveform)
+    
+    return (
+        chunk_fp.waveform, flow_sig.flow_sequence, flow_sig.rhythm_pattern,
+        flow_sig.dominant_flow.name,
+        ','.join(f"{e:.3f}" for e in flow_sig.energy_contour[:20])
+    )
+
+
+# Per-process encoder state for parallel indexing
+_worker_generator: Optional[AudioFingerprintGenerator] = None
+_worker_flow: Optional[TemporalDotFlow] = None
+
+
+def _init_chunk_worker(width: int, height: int):
+    """ProcessPoolExecutor initializer: build one encoder per worker."""
+    global _worker_generator, _worker_flow
+    _worker_generator = AudioFingerprintGenerator(width=width, height=height)
+    _worker_flow = TemporalDotFlow()
+
+
+def _encode_chunk(chunk: List[float], sample_rate: int) -> tuple:
+    """Worker entry point for parallel indexing."""
+    return _encode_chunk_with(_worker_generator, _worker_flow, chunk, sample_rate)
+
+
 class DotFlowSearch:
     """
     Audio search using Temporal Dot-Flow Encoding.
@@ -49,17 +104,122 @@ class DotFlowSearch:
     - Two different audio files can match if they "feel" the same
     """
     
+    # Number of leading flow symbols hashed for the coarse filter
+    FLOW_PREFIX_LEN = 8
+    
+    # Hot queries; sqlite3 keeps them compiled in the connection's
+    # statement cache as long as the connection stays open
+    _INSERT_CHUNK = '''
+        INSERT OR REPLACE INTO flow_chunks
+        (chunk_id, video_id, video_title, start_time, duration,
+         waveform, flow_sequence, rhythm_pattern, dominant_flow,
+         energy_contour, created_at, flow_prefix_hash)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+    _SELECT_BY_DOMINANT = 'SELECT * FROM flow_chunks WHERE dominant_flow = ?'
+    _SELECT_ALL = 'SELECT * FROM flow_chunks'
+    _SELECT_VECTOR_FIELDS = 'SELECT chunk_id, waveform, energy_contour FROM flow_chunks'
+    
+    # ANN candidates fetched per requested result, re-ranked exactly
+    ANN_CANDIDATES_PER_RESULT = 20
+    # IVF-PQ: lists probed per query, and bits per PQ sub-quantizer code
+    IVF_NPROBE = 8
+    PQ_NBITS = 8
+    # HNSW: graph degree, and beam widths while building / searching
+    HNSW_M = 32
+    HNSW_EF_CONSTRUCTION = 200
+    HNSW_EF_SEARCH = 64
+    
+    ANN_INDEX_TYPES = ('ivfpq', 'hnsw', 'flat', 'binary')
+    
     def __init__(self, db_path: str = "dotflow_audio.db",
-                 chunk_duration: float = 3.0):
+                 chunk_duration: float = 3.0, workers: Optional[int] = None,
+                 ann_index: Optional[str] = None):
+        """
+        Args:
+            ann_index: None to filter candidates in SQL, or one of
+                ANN_INDEX_TYPES to retrieve them from a FAISS index (see
+                build_ann_index): 'ivfpq' is compact, 'hnsw' favours
+                recall, 'flat' is an exact scan, 'binary' scans the raw
+                dot bits by Hamming distance (one bit per dot)
+        """
+        if ann_index is not None:
+            if ann_index not in self.ANN_INDEX_TYPES:
+                raise ValueError(f"Unknown ANN index type: {ann_index}")
+            if not HAS_FAISS:
+                raise ImportError(f"faiss is required for ann_index='{ann_index}'")
+        
         self.db_path = db_path
         self.chunk_duration = chunk_duration
+        self.workers = workers or os.cpu_count() or 1
+        # Encoder processes, started on first use and shared by every
+        # index_audio_* call until close()
+        self._pool: Optional[ProcessPoolExecutor] = None
         self.flow = TemporalDotFlow()
         self.generator = AudioFingerprintGenerator(width=40, height=2)
+        
+        # ANN vectors: one 0/1 component per dot (squared L2 == Hamming
+        # distance) plus the energy contour, scaled so both parts carry
+        # the same relative weight they have in the combined score
+        # (0.3 pattern vs 0.7 * 0.25 energy)
+        self.vector_dim = self.generator.width * 8 + CONTOUR_LEN
+        self._energy_scale = math.sqrt(0.175 / 0.3 / 4 * self.generator.width * 8)
+        
+        self.ann_index = ann_index
+        self.ann_path = f"{db_path}.faiss"
+        self._ann = None
+        self._ann_ids: Optional[np.ndarray] = None
+        self._ann_stale = True
+        
+        # One connection for the object's lifetime
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
         self._init_database()
+        
+        if ann_index is not None and os.path.exists(self.ann_path):
+            read = faiss.read_index_binary if ann_index == 'binary' else faiss.read_index
+            try:
+                self._ann = read(self.ann_path)
+            except RuntimeError:
+                # Saved as the other (binary vs float) family; rebuilt on
+                # first search
+                self._ann = None
+        
+        if self._ann is not None:
+            if isinstance(self._ann, faiss.IndexHNSWFlat):
+                self._ann.hnsw.efSearch = self.HNSW_EF_SEARCH
+            self._ann_ids = np.load(f"{self.ann_path}.ids.npy")
+            # An index saved with another type is rebuilt on first search
+            self._ann_stale = not isinstance(self._ann, {
+                'ivfpq': (faiss.IndexIVFPQ, faiss.IndexFlatL2),
+                'hnsw': faiss.IndexHNSWFlat,
+                'flat': faiss.IndexFlatL2,
+                'binary': faiss.IndexBinaryFlat,
+            }[ann_index])
+    
+    def close(self):
+        """Close the database connection and stop encoder processes."""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def __del__(self):
+        # __init__ may have failed before the connection existed
+        if getattr(self, '_conn', None) is not None or getattr(self, '_pool', None) is not None:
+            self.close()
     
     def _init_database(self):
         """Initialize database with flow-specific columns."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -70,14 +230,38 @@ class DotFlowSearch:
                 start_time REAL,
                 duration REAL,
                 waveform TEXT,
-                flow_sequence TEXT,
+                flow_sequence BLOB,
                 rhythm_pattern TEXT,
                 dominant_flow TEXT,
                 energy_contour TEXT,
-                created_at TEXT
+                created_at TEXT,
+                flow_prefix_hash INTEGER
             )
         ''')
         
+        # Databases created before the prefix hash existed need the column
+        cursor.execute('PRAGMA table_info(flow_chunks)')
+        columns = {row[1] for row in cursor.fetchall()}
+        if 'flow_prefix_hash' not in columns:
+            cursor.execute('ALTER TABLE flow_chunks ADD COLUMN flow_prefix_hash INTEGER')
+        
+        # Older databases stored flow sequences as symbol text and have no
+        # prefix hashes; convert them so every row takes the same path
+        cursor.execute('''
+            SELECT chunk_id, flow_sequence FROM flow_chunks
+            WHERE typeof(flow_sequence) = 'text' OR flow_prefix_hash IS NULL
+        ''')
+        updates = []
+        for chunk_id, flow_sequence in cursor.fetchall():
+            if isinstance(flow_sequence, str):
+                flow_sequence = self.flow.flow_bytes(flow_sequence)
+            flow_sequence = flow_sequence or b""
+            updates.append((flow_sequence, self._flow_prefix_hash(flow_sequence), chunk_id))
+        cursor.executemany(
+            'UPDATE flow_chunks SET flow_sequence = ?, flow_prefix_hash = ? WHERE chunk_id = ?',
+            updates
+        )
+        
         cursor.execute('''
             CREATE INDEX IF NOT EXISTS idx_flow_seq 
             ON flow_chunks(flow_sequence)
@@ -88,6 +272,13 @@ class DotFlowSearch:
             ON flow_chunks(dominant_flow)
         ''')
         
+        # Narrow index for the coarse filter: resolves candidates
+        # without touching the wide waveform/contour columns
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_flow_hash
+            ON flow_chunks(dominant_flow, flow_prefix_hash)
+        ''')
+        
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS videos (
                 video_id TEXT PRIMARY KEY,
@@ -99,12 +290,20 @@ class DotFlowSearch:
         ''')
         
         conn.commit()
-        conn.close()
     
     def index_audio_file(self, audio_path: str, video_id: str,
                          video_title: str, video_url: str = "") -> int:
         """Index an audio file using dot-flow encoding."""
-        with wave.open(audio_path, 'rb') as wav:
+        with open(audio_path, 'rb') as f:
+            return self.index_audio_stream(f, video_id, video_title, video_url)
+    
+    def index_audio_stream(self, fileobj: BinaryIO, video_id: str,
+                           video_title: str, video_url: str = "") -> int:
+        """
+        Index WAV data from a binary file object (e.g. an in-memory
+        io.BytesIO), so callers holding WAV bytes need no temp file.
+        """
+        with wave.open(fileobj, 'rb') as wav:
             sample_rate = wav.getframerate()
             n_frames = wav.getnframes()
             n_channels = wav.getnchannels()
@@ -112,12 +311,26 @@ class DotFlowSearch:
             raw_data = wav.readframes(n_frames)
         
         samples = self._bytes_to_samples(raw_data, sample_width, n_channels)
+        return self.index_audio_array(samples, sample_rate, video_id,
+                                      video_title, video_url)
+    
+    def index_audio_array(self, samples, sample_rate: int, video_id: str,
+                          video_title: str, video_url: str = "") -> int:
+        """
+        Index already-decoded audio using dot-flow encoding.
+        
+        Args:
+            samples: Mono samples normalized to -1.0..1.0 (list or ndarray)
+            sample_rate: Sample rate in Hz
+        """
+        if isinstance(samples, np.ndarray):
+            # The fingerprint generator works on Python float lists
+            samples = samples.tolist()
         duration = len(samples) / sample_rate
         
         chunk_samples = int(self.chunk_duration * sample_rate)
-        chunks_indexed = 0
         
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -127,51 +340,59 @@ class DotFlowSearch:
         ''', (video_id, video_title, duration, video_url, 
               datetime.now().isoformat()))
         
-        for i in range(0, len(samples) - chunk_samples, chunk_samples // 2):
-            chunk = samples[i:i + chunk_samples]
-            start_time = i / sample_rate
-            
-            # Generate fingerprint
-            chunk_fp = self.generator.from_samples(chunk, sample_rate)
-            
-            # Encode as flow signature (THE NOVEL PART)
-            flow_sig = self.flow.encode(chunk_fp.waveform)
-            
-            chunk_id = f"{video_id}_{i}"
-            
-            cursor.execute('''
-                INSERT OR REPLACE INTO flow_chunks
-                (chunk_id, video_id, video_title, start_time, duration,
-                 waveform, flow_sequence, rhythm_pattern, dominant_flow,
-                 energy_contour, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                chunk_id, video_id, video_title, start_time, self.chunk_duration,
-                chunk_fp.waveform, flow_sig.flow_sequence, flow_sig.rhythm_pattern,
-                flow_sig.dominant_flow.name,
-                ','.join(f"{e:.3f}" for e in flow_sig.energy_contour[:20]),
-                datetime.now().isoformat()
+        offsets = range(0, len(samples) - chunk_samples, chunk_samples // 2)
+        chunks = [samples[i:i + chunk_samples] for i in offsets]
+        
+        # Chunks are independent: fingerprint/encode them across processes
+        # and keep the DB writes in this thread, in order
+        if self.workers > 1 and len(chunks) > 1:
+            encoded = list(self._chunk_pool().map(
+                _encode_chunk, chunks, repeat(sample_rate), chunksize=8
+            ))
+        else:
+            encoded = [
+                _encode_chunk_with(self.generator, self.flow, chunk, sample_rate)
+                for chunk in chunks
+            ]
+        
+        rows = []
+        for i, (waveform, flow_sequence, rhythm, dominant, energy) in zip(offsets, encoded):
+            rows.append((
+                f"{video_id}_{i}", video_id, video_title, i / sample_rate,
+                self.chunk_duration, waveform, flow_sequence, rhythm, dominant,
+                energy, datetime.now().isoformat(),
+                self._flow_prefix_hash(flow_sequence)
             ))
-            
-            chunks_indexed += 1
+        
+        cursor.executemany(self._INSERT_CHUNK, rows)
+        chunks_indexed = len(rows)
         
         conn.commit()
-        conn.close()
+        self._ann_stale = True
         
         print(f"✅ Indexed {chunks_indexed} flow chunks from '{video_title}'")
         return chunks_indexed
     
+    def _chunk_pool(self) -> ProcessPoolExecutor:
+        """Encoder pool, reused across videos so workers start only once."""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_chunk_worker,
+                initargs=(self.generator.width, self.generator.height)
+            )
+        return self._pool
+    
     def index_youtube(self, url: str) -> int:
         """Index a YouTube video."""
         from youtube_fingerprint import YouTubeFingerprint
         
         yt = YouTubeFingerprint(keep_audio=True)
-        info = yt._get_video_info(yt._normalize_url(url))
+        # One yt-dlp run both downloads and reports the video info
+        audio_path, info = yt._download(url)
         video_id = info.get('id', url)
         title = info.get('title', 'Unknown')
         
-        audio_path = yt.download_audio(url)
-        
         try:
             return self.index_audio_file(
                 audio_path, video_id, title,
@@ -191,24 +412,49 @@ class DotFlowSearch:
         2. Rhythm pattern (where energy changes occur)
         3. Dominant flow direction
         """
+        if isinstance(query_samples, np.ndarray):
+            # The fingerprint generator works on Python float lists
+            query_samples = query_samples.tolist()
         query_fp = self.generator.from_samples(query_samples, sample_rate)
         query_flow = self.flow.encode(query_fp.waveform)
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        if self.ann_index is not None:
+            candidates = self._ann_candidates(query_fp.waveform, query_flow, top_k)
+        else:
+            candidates = self._sql_candidates(query_flow)
         
-        # First: filter by dominant flow (coarse)
-        cursor.execute('''
-            SELECT * FROM flow_chunks WHERE dominant_flow = ?
-        ''', (query_flow.dominant_flow.name,))
+        return self._rank(query_fp.waveform, query_flow, candidates,
+                          top_k, min_similarity)
+    
+    def _sql_candidates(self, query_flow: FlowSignature) -> List[tuple]:
+        """Candidate rows from the prefix-hash / dominant-flow cascade."""
+        cursor = self._conn.cursor()
+        
+        # First: filter by dominant flow + Hamming-close flow prefixes (coarse)
+        prefix_hashes = self._neighbour_prefix_hashes(query_flow.flow_sequence)
+        placeholders = ','.join('?' * len(prefix_hashes))
+        cursor.execute(f'''
+            SELECT * FROM flow_chunks
+            WHERE dominant_flow = ? AND flow_prefix_hash IN ({placeholders})
+        ''', (query_flow.dominant_flow.name, *prefix_hashes))
         
         candidates = cursor.fetchall()
         
-        # Fallback to all if no matches
+        # Widen to the whole dominant flow, then to all, if nothing survived
+        if not candidates:
+            cursor.execute(self._SELECT_BY_DOMINANT, (query_flow.dominant_flow.name,))
+            candidates = cursor.fetchall()
+        
         if not candidates:
-            cursor.execute('SELECT * FROM flow_chunks')
+            cursor.execute(self._SELECT_ALL)
             candidates = cursor.fetchall()
         
+        return candidates
+    
+    def _rank(self, query_waveform: str, query_flow: FlowSignature,
+              candidates: List[tuple], top_k: int,
+              min_similarity: float) -> List[FlowSearchResult]:
+        """Score candidate rows exactly and keep the best top_k."""
         results = []
         for row in candidates:
             # Reconstruct flow signature from stored data
@@ -225,7 +471,7 @@ class DotFlowSearch:
             flow_sim = self.flow.flow_similarity(query_flow, stored_flow)
             
             # Also compute traditional pattern similarity for comparison
-            pattern_sim = self._pattern_similarity(query_fp.waveform, row[5])
+            pattern_sim = self._pattern_similarity(query_waveform, row[5])
             
             # Combined score (flow-weighted)
             combined = flow_sim * 0.7 + pattern_sim * 0.3
@@ -238,54 +484,186 @@ class DotFlowSearch:
                     flow_similarity=flow_sim,
                     pattern_similarity=pattern_sim,
                     combined_score=combined,
-                    query_flow=query_flow.flow_sequence[:30],
-                    matched_flow=stored_flow.flow_sequence[:30],
+                    query_flow=self.flow.flow_symbols(query_flow.flow_sequence[:30]),
+                    matched_flow=self.flow.flow_symbols(stored_flow.flow_sequence[:30]),
                     dominant_flow=stored_flow.dominant_flow.name,
                     youtube_url=f"https://youtube.com/watch?v={row[1]}&t={int(row[3])}"
                 ))
         
-        conn.close()
-        
         results.sort(key=lambda x: x.combined_score, reverse=True)
         return results[:top_k]
     
+    def _chunk_masks(self, waveforms: List[str]) -> np.ndarray:
+        """
+        uint8 (N, width) dot masks, one byte per braille cell.
+        
+        Already bit-packed, so these are the binary index codes as-is:
+        their Hamming distance is the dot distance of _pattern_similarity.
+        """
+        cells = self.generator.width
+        masks = np.zeros((len(waveforms), cells), dtype=np.uint8)
+        for i, waveform in enumerate(waveforms):
+            m = braille_to_masks(waveform[:cells])
+            masks[i, :len(m)] = m
+        return masks
+    
+    def _chunk_vectors(self, waveforms: List[str],
+                       energy_norms: List[Optional[np.ndarray]]) -> np.ndarray:
+        """ANN vectors for fingerprinted chunks: packed dot masks for the
+        binary index, otherwise float32 (N, vector_dim)."""
+        masks = self._chunk_masks(waveforms)
+        if self.ann_index == 'binary':
+            return masks
+        
+        cells = self.generator.width
+        x = np.zeros((len(waveforms), self.vector_dim), dtype=np.float32)
+        x[:, :cells * 8] = np.unpackbits(masks, axis=1)
+        for i, energy in enumerate(energy_norms):
+            if energy is not None:
+                x[i, cells * 8:cells * 8 + len(energy)] = energy * self._energy_scale
+        return x
+    
+    def _new_ann(self, n: int):
+        """Empty FAISS index of the configured type, sized for n vectors."""
+        d = self.vector_dim
+        
+        if self.ann_index == 'binary':
+            return faiss.IndexBinaryFlat(self.generator.width * 8)
+        
+        if self.ann_index == 'hnsw':
+            index = faiss.IndexHNSWFlat(d, self.HNSW_M)
+            index.hnsw.efConstruction = self.HNSW_EF_CONSTRUCTION
+            index.hnsw.efSearch = self.HNSW_EF_SEARCH
+            return index
+        
+        # PQ codebooks need at least 2**nbits training points; tiny
+        # indexes are searched exactly instead
+        if self.ann_index == 'flat' or n < 2 ** self.PQ_NBITS:
+            return faiss.IndexFlatL2(d)
+        
+        nlist = max(1, int(4 * math.sqrt(n)))
+        quantizer = faiss.IndexFlatL2(d)
+        index = faiss.IndexIVFPQ(quantizer, d, nlist, d // 4, self.PQ_NBITS)
+        index.nprobe = self.IVF_NPROBE
+        return index
+    
+    def build_ann_index(self) -> int:
+        """
+        (Re)build the ANN index over every stored chunk in one batch.
+        
+        Vectors are trained and added in a single call and persisted next
+        to the database as <db_path>.faiss (+ .ids.npy mapping vector
+        positions back to chunk_id).
+        
+        Returns:
+            Number of vectors indexed
+        """
+        cursor = self._conn.cursor()
+        cursor.execute(self._SELECT_VECTOR_FIELDS)
+        rows = cursor.fetchall()
+        
+        ids = np.array([row[0] for row in rows], dtype=str)
+        energy = []
+        for row in rows:
+            contour = [float(x) for x in row[2].split(',') if x]
+            energy.append(_normalize_contour(contour, min(len(contour), CONTOUR_LEN)))
+        x = self._chunk_vectors([row[1] for row in rows], energy)
+        
+        index = self._new_ann(len(rows))
+        if len(rows):
+            if not index.is_trained:
+                index.train(x)
+            index.add(x)
+        
+        if self.ann_index == 'binary':
+            faiss.write_index_binary(index, self.ann_path)
+        else:
+            faiss.write_index(index, self.ann_path)
+        np.save(f"{self.ann_path}.ids.npy", ids)
+        
+        self._ann, self._ann_ids = index, ids
+        self._ann_stale = False
+        return len(rows)
+    
+    def _ann_candidates(self, query_waveform: str, query_flow: FlowSignature,
+                        top_k: int) -> List[tuple]:
+        """Candidate rows for the query's nearest ANN vectors."""
+        if self._ann is None or self._ann_stale:
+            self.build_ann_index()
+        if self._ann.ntotal == 0:
+            return []
+        
+        k = min(self._ann.ntotal, top_k * self.ANN_CANDIDATES_PER_RESULT)
+        q = self._chunk_vectors([query_waveform], [query_flow.energy_norm])
+        _, neighbours = self._ann.search(q, k)
+        
+        chunk_ids = [str(cid) for cid in self._ann_ids[neighbours[0][neighbours[0] >= 0]]]
+        if not chunk_ids:
+            return []
+        
+        placeholders = ','.join('?' * len(chunk_ids))
+        cursor = self._conn.cursor()
+        cursor.execute(
+            f'SELECT * FROM flow_chunks WHERE chunk_id IN ({placeholders})', chunk_ids
+        )
+        return cursor.fetchall()
+    
+    def _flow_prefix_hash(self, flow_sequence: bytes) -> int:
+        """32-bit hash of the leading flow symbols, used for blocking."""
+        return zlib.crc32(flow_sequence[:self.FLOW_PREFIX_LEN])
+    
+    def _neighbour_prefix_hashes(self, flow_sequence: bytes) -> List[int]:
+        """
+        Hashes of the query prefix and every prefix one substitution away.
+        
+        Acts as a cheap locality-sensitive hash: a stored chunk whose
+        prefix differs from the query in at most one flow symbol still
+        lands in the candidate set.
+        """
+        prefix = flow_sequence[:self.FLOW_PREFIX_LEN]
+        
+        hashes = {self._flow_prefix_hash(prefix)}
+        for i, current in enumerate(prefix):
+            for direction in FlowDirection:
+                if direction.value != current:
+                    variant = prefix[:i] + bytes((direction.value,)) + prefix[i + 1:]
+                    hashes.add(self._flow_prefix_hash(variant))
+        return sorted(hashes)
+    
     def _pattern_similarity(self, a: str, b: str) -> float:
         """Traditional Hamming distance similarity."""
         if not a or not b:
             return 0.0
         
         max_len = max(len(a), len(b))
-        a = a.ljust(max_len, chr(0x2800))
-        b = b.ljust(max_len, chr(0x2800))
         
-        distance = 0
-        for ca, cb in zip(a, b):
-            bits_a = ord(ca) - 0x2800 if ord(ca) >= 0x2800 else 0
-            bits_b = ord(cb) - 0x2800 if ord(cb) >= 0x2800 else 0
-            distance += bin(bits_a ^ bits_b).count('1')
+        # Pad the shorter string with blank cells (mask 0)
+        masks_a = np.zeros(max_len, dtype=np.uint8)
+        masks_b = np.zeros(max_len, dtype=np.uint8)
+        masks_a[:len(a)] = braille_to_masks(a)
+        masks_b[:len(b)] = braille_to_masks(b)
+        distance = dot_hamming(masks_a, masks_b)
         
         max_distance = max_len * 8
         return 1.0 - (distance / max_distance)
     
     def _bytes_to_samples(self, raw_data: bytes, sample_width: int,
-                          n_channels: int) -> List[float]:
-        """Convert raw audio to normalized samples."""
-        if sample_width == 1:
-            fmt, max_val, offset = 'B', 128.0, 128
-        elif sample_width == 2:
-            fmt, max_val, offset = 'h', 32768.0, 0
+                          n_channels: int) -> np.ndarray:
+        """Convert raw PCM to mono samples normalized to -1.0..1.0."""
+        if sample_width == 3:
+            # No 24-bit dtype: assemble little-endian bytes, sign-extend
+            b = np.frombuffer(raw_data, dtype=np.uint8)
+            b = b[:len(b) - len(b) % 3].reshape(-1, 3).astype(np.int32)
+            pcm = ((b[:, 0] | b[:, 1] << 8 | b[:, 2] << 16) ^ 0x800000) - 0x800000
+            max_val, offset = 8388608.0, 0
         else:
-            fmt, max_val, offset = 'i', 2147483648.0, 0
+            dtype, max_val, offset = _PCM_FORMATS.get(sample_width, _PCM_FORMATS[4])
+            pcm = np.frombuffer(raw_data, dtype=dtype,
+                                count=len(raw_data) // np.dtype(dtype).itemsize)
         
-        n_samples = len(raw_data) // sample_width
-        samples = struct.unpack(f'<{n_samples}{fmt}', raw_data)
-        
-        if n_channels == 2:
-            mono = [(samples[i] + samples[i+1]) / 2 
-                    for i in range(0, len(samples) - 1, 2)]
-            samples = mono
-        
-        return [(s - offset) / max_val for s in samples]
+        # Average channels to mono (zero-copy view of the interleaved frames)
+        frames = pcm[:len(pcm) - len(pcm) % n_channels].reshape(-1, n_channels)
+        return (frames.mean(axis=1) - offset) / max_val
     
     def format_results(self, results: List[FlowSearchResult]) -> str:
         """Format results with flow information."""
@@ -316,8 +694,7 @@ class DotFlowSearch:
     
     def get_stats(self) -> Dict[str, Any]:
         """Get database statistics."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
         
         cursor.execute('SELECT COUNT(*) FROM videos')
         n_videos = cursor.fetchone()[0]
@@ -328,8 +705,6 @@ class DotFlowSearch:
         cursor.execute('SELECT dominant_flow, COUNT(*) FROM flow_chunks GROUP BY dominant_flow')
         flow_dist = dict(cursor.fetchall())
         
-        conn.close()
-        
         return {
             'videos': n_videos,
             'chunks': n_chunks,
@@ -361,11 +736,8 @@ def demo():
             wav.setnchannels(1)
             wav.setsampwidth(2)
             wav.setframerate(44100)
-            pcm = b''.join(
-                struct.pack('<h', int(max(-1, min(1, s)) * 32767))
-                for s in samples
-            )
-            wav.writeframes(pcm)
+            pcm = np.clip(np.asarray(samples, dtype=np.float32), -1.0, 1.0)
+            wav.writeframes((pcm * 32767.0).astype('<i2').tobytes())
         
         search.index_audio_file(
             temp_path, f"test_{audio_type}",
@@ -384,6 +756,7 @@ def demo():
     print(search.format_results(results))
     
     # Cleanup
+    search.close()
     os.remove("dotflow_demo.db")
     print("\n✨ Demo complete!")
 
@@ -21,26 +21,138 @@ Methodology:
 import os
 import sys
 import json
+import keyword
+import logging
+import math
 import time
 import asyncio
+import mmap
+import re
+import shelve
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
 from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from typing import List, Dict, Tuple, Optional
-from collections import Counter
-import statistics
 import hashlib
 
+import numpy as np
+
+# C JSON serializer for save_results; stdlib json is the fallback
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+logger = logging.getLogger(__name__)
+
 # Add parent paths
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from braille8_core import Braille8Encoder, text_to_braille8
 
-# Transformers for tokenization comparison
+# Transformers for tokenization comparison. Must be set before the Rust
+# tokenizers library is loaded so batched calls use all cores.
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "true")
 try:
     from transformers import AutoTokenizer
     HAS_TRANSFORMERS = True
 except ImportError:
     HAS_TRANSFORMERS = False
 
+# Braille encodings and token counts keyed by sha1 of the sample source,
+# reused across experiment runs
+CACHE_PATH = Path.home() / ".cache" / "sal-voice" / "experiment_cache"
+
+
+@lru_cache(maxsize=4)
+def _get_tokenizer(name: str, **kwargs):
+    """Load a fast tokenizer once per process and share it between experiments."""
+    return AutoTokenizer.from_pretrained(name, use_fast=True, **kwargs)
+
+
+# Samples are capped in UTF-8 bytes, which is what tokenizers and zlib
+# actually pay for, rather than in characters
+MAX_SAMPLE_BYTES = 10000
+
+
+def _read_capped(filepath: Path) -> Optional[str]:
+    """Read a source file capped at 10K bytes; None if tiny or unreadable."""
+    try:
+        if filepath.stat().st_size < 4096:
+            # Small file: mmap setup costs more than it saves
+            code = filepath.read_text(encoding='utf-8', errors='ignore')
+        else:
+            # A character split by the cap is dropped by errors='ignore'
+            with open(filepath, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                head = mm[:MAX_SAMPLE_BYTES]
+            code = head.decode('utf-8', errors='ignore')
+            code = code.replace('\r\n', '\n').replace('\r', '\n')  # as text mode
+    except (OSError, ValueError) as e:
+        # ValueError covers mmap of a file truncated to empty since stat()
+        logger.debug("Skipping unreadable %s: %s", filepath, e)
+        return None
+    if len(code) <= 100:  # Skip tiny files
+        return None
+    return code
+
+
+# Python keywords from the running interpreter (True/False/None and
+# async/await are included in kwlist)
+_PY_KEYWORDS = frozenset(keyword.kwlist)
+
+# Same boundaries as str.split()
+WORD_RE = re.compile(r'\S+')
+
+# Experiment 3 compares how compressible ASCII and braille are relative to
+# each other, not archival size; level 1 ranks them the same as the default
+# level 6 at a fraction of the CPU cost
+COMPRESSION_LEVEL = 1
+
+
+def _compress_pair(pair: Tuple[bytes, bytes]) -> Tuple[float, float]:
+    """zlib compressed/original size ratio for an (ascii, braille) byte pair."""
+    ascii_bytes, braille_bytes = pair
+    return (len(zlib.compress(ascii_bytes, COMPRESSION_LEVEL)) / len(ascii_bytes),
+            len(zlib.compress(braille_bytes, COMPRESSION_LEVEL)) / len(braille_bytes))
+
+
+def _finite_for_json(value):
+    """
+    Copy of a JSON-ready structure with non-finite floats replaced by None.
+    
+    orjson writes inf/nan as null while stdlib json writes the non-standard
+    Infinity/NaN, so save_results converts them first to get the same file
+    from either serializer.
+    """
+    if isinstance(value, (float, np.floating)):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {k: _finite_for_json(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite_for_json(v) for v in value]
+    return value
+
+
+def count_repeated_ngrams(text: str, n: int, min_count: int = 3) -> int:
+    """
+    Number of distinct character n-grams occurring at least `min_count` times.
+    
+    Works on UTF-32 codepoints so each window is exactly n characters, and
+    counts windows with np.unique instead of building one str per position.
+    """
+    cp = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+    if len(cp) < n:
+        return 0
+    
+    windows = np.ascontiguousarray(np.lib.stride_tricks.sliding_window_view(cp, n))
+    keys = windows.view(np.dtype((np.void, 4 * n))).ravel()
+    _, counts = np.unique(keys, return_counts=True)
+    return int((counts >= min_count).sum())
+
 
 @dataclass
 class ExperimentResult:
@@ -63,11 +175,52 @@ class CodeSample:
     braille_code: str = ""
     ascii_tokens: int = 0
     braille_tokens: int = 0
+    content_hash: str = ""
+    ascii_bytes: bytes = field(init=False, repr=False, compare=False)
+    braille_bytes: bytes = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
+        self.ascii_bytes = self.ascii_code.encode('utf-8')
+        if not self.content_hash:
+            self.content_hash = hashlib.sha1(self.ascii_bytes).hexdigest()
         if not self.braille_code:
             encoder = Braille8Encoder()
             self.braille_code = encoder.encode(self.ascii_code)
+        self.braille_bytes = self.braille_code.encode('utf-8')
+    
+    @cached_property
+    def ascii_codepoints(self) -> np.ndarray:
+        """ASCII source as a uint32 codepoint array"""
+        return np.frombuffer(self.ascii_code.encode('utf-32-le'), dtype=np.uint32)
+    
+    @cached_property
+    def braille_codepoints(self) -> np.ndarray:
+        """Braille encoding as a uint32 codepoint array"""
+        return np.frombuffer(self.braille_code.encode('utf-32-le'), dtype=np.uint32)
+    
+    @cached_property
+    def word_pairs(self) -> List[Tuple[str, str]]:
+        """(ascii_word, braille_word) for each whitespace-separated word"""
+        # One braille cell per character, so words share offsets
+        return [(m.group(), self.braille_code[m.start():m.end()])
+                for m in WORD_RE.finditer(self.ascii_code)]
+    
+    @cached_property
+    def ascii_unique(self) -> int:
+        """Number of distinct characters in the ASCII source"""
+        return int(np.unique(self.ascii_codepoints).size)
+    
+    @cached_property
+    def braille_unique(self) -> int:
+        """Number of distinct braille cells in the encoding"""
+        # Cells live in U+2800-U+28FF, so a 256-slot presence table replaces
+        # the sort in np.unique (uint32 wraps anything below the block)
+        cells = self.braille_codepoints - 0x2800
+        if cells.size and cells.max() > 0xFF:
+            return int(np.unique(self.braille_codepoints).size)
+        used = np.zeros(256, dtype=bool)
+        used[cells] = True
+        return int(used.sum())
 
 
 class BrailleCodeExperiment:
@@ -76,53 +229,83 @@ class BrailleCodeExperiment:
     representation for code than ASCII.
     """
     
-    def __init__(self, code_dir: str = None):
+    def __init__(self, code_dir: str = None, use_cache: bool = True):
         self.encoder = Braille8Encoder()
         self.code_dir = Path(code_dir) if code_dir else Path.home() / "sal-voice"
+        self.use_cache = use_cache
         self.results: List[ExperimentResult] = []
         self.samples: List[CodeSample] = []
+        self._stats: Optional[Dict[str, np.ndarray]] = None
         
         # Load tokenizers for comparison
         self.tokenizers = {}
         if HAS_TRANSFORMERS:
             try:
-                self.tokenizers['llama'] = AutoTokenizer.from_pretrained(
+                self.tokenizers['llama'] = _get_tokenizer(
                     "meta-llama/Llama-2-7b-hf", 
                     token=os.environ.get('HF_TOKEN'),
                     trust_remote_code=True
                 )
-            except:
-                pass
+            except (OSError, ValueError, ImportError) as e:
+                logger.debug("Llama tokenizer unavailable: %s", e)
             try:
-                self.tokenizers['gpt2'] = AutoTokenizer.from_pretrained("gpt2")
-            except:
-                pass
+                self.tokenizers['gpt2'] = _get_tokenizer("gpt2")
+            except (OSError, ValueError, ImportError) as e:
+                logger.debug("GPT-2 tokenizer unavailable: %s", e)
                 
+    def _open_cache(self):
+        """Open the on-disk result cache (a throwaway dict when disabled)."""
+        if not self.use_cache:
+            return nullcontext({})
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        return shelve.open(str(CACHE_PATH))
+    
     def collect_code_samples(self, max_files: int = 100) -> List[CodeSample]:
         """Collect code samples from the codebase"""
         samples = []
         extensions = {'.py': 'python', '.js': 'javascript', '.ts': 'typescript', 
                       '.go': 'go', '.rs': 'rust', '.java': 'java'}
         
-        for ext, lang in extensions.items():
-            for filepath in self.code_dir.rglob(f"*{ext}"):
-                if len(samples) >= max_files:
-                    break
-                if '.git' in str(filepath) or 'node_modules' in str(filepath):
-                    continue
+        paths = [
+            (filepath, lang)
+            for ext, lang in extensions.items()
+            for filepath in self.code_dir.rglob(f"*{ext}")
+            if '.git' not in str(filepath) and 'node_modules' not in str(filepath)
+        ]
+        
+        # Reads release the GIL, so overlap them; map() keeps path order
+        executor = ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 4)
+        try:
+            codes = executor.map(_read_capped, [p for p, _ in paths])
+            with self._open_cache() as cache:
+                for (filepath, lang), code in zip(paths, codes):
+                    if len(samples) >= max_files:
+                        break
+                    if code is None:
+                        continue
                     
-                try:
-                    code = filepath.read_text(encoding='utf-8', errors='ignore')
-                    if len(code) > 100:  # Skip tiny files
-                        samples.append(CodeSample(
-                            filename=str(filepath),
-                            language=lang,
-                            ascii_code=code[:10000]  # Cap at 10K chars
-                        ))
-                except:
-                    continue
+                    key = hashlib.sha1(code.encode('utf-8')).hexdigest()
+                    entry = cache.get(key)
+                    sample = CodeSample(
+                        filename=str(filepath),
+                        language=lang,
+                        ascii_code=code,
+                        braille_code=entry['braille'] if entry else "",
+                        content_hash=key
+                    )
+                    if not entry:
+                        cache[key] = {'braille': sample.braille_code}
+                    samples.append(sample)
+        finally:
+            # Don't read files we no longer need once max_files is reached
+            executor.shutdown(cancel_futures=True)
                     
+        # Largest first: an interrupted run has already covered most of the
+        # corpus, and batched tokenization sees similar-sized neighbours
+        samples.sort(key=lambda s: len(s.ascii_bytes), reverse=True)
+        
         self.samples = samples
+        self._stats = None
         print(f"Collected {len(samples)} code samples")
         return samples
         
@@ -138,38 +321,18 @@ class BrailleCodeExperiment:
         
         if not self.tokenizers:
             print("No tokenizers available - using character-based estimation")
-            # Fallback: estimate tokens as chars/4
-            ascii_tokens = []
-            braille_tokens = []
             
-            for sample in self.samples:
-                ascii_tok = len(sample.ascii_code) / 4
-                braille_tok = len(sample.braille_code) / 4
-                ascii_tokens.append(ascii_tok)
-                braille_tokens.append(braille_tok)
-                sample.ascii_tokens = int(ascii_tok)
-                sample.braille_tokens = int(braille_tok)
-        else:
-            tokenizer = self.tokenizers.get('gpt2') or list(self.tokenizers.values())[0]
-            ascii_tokens = []
-            braille_tokens = []
-            
-            for sample in self.samples:
-                ascii_tok = len(tokenizer.encode(sample.ascii_code))
-                braille_tok = len(tokenizer.encode(sample.braille_code))
-                ascii_tokens.append(ascii_tok)
-                braille_tokens.append(braille_tok)
-                sample.ascii_tokens = ascii_tok
-                sample.braille_tokens = braille_tok
-                
-        avg_ascii = statistics.mean(ascii_tokens)
-        avg_braille = statistics.mean(braille_tokens)
+        per_sample = self._compute_per_sample_stats()
+        ascii_arr = per_sample['ascii_toks']
+        braille_arr = per_sample['braille_toks']
+        avg_ascii = float(ascii_arr.mean())
+        avg_braille = float(braille_arr.mean())
         ratio = avg_braille / avg_ascii
         
         # Statistical significance
         from scipy import stats
         try:
-            t_stat, p_value = stats.ttest_rel(braille_tokens, ascii_tokens)
+            t_stat, p_value = stats.ttest_rel(braille_arr, ascii_arr)
         except:
             p_value = None
             
@@ -181,10 +344,10 @@ class BrailleCodeExperiment:
             p_value=p_value,
             sample_size=len(self.samples),
             details={
-                'ascii_tokens_total': sum(ascii_tokens),
-                'braille_tokens_total': sum(braille_tokens),
-                'ascii_tokens_std': statistics.stdev(ascii_tokens) if len(ascii_tokens) > 1 else 0,
-                'braille_tokens_std': statistics.stdev(braille_tokens) if len(braille_tokens) > 1 else 0,
+                'ascii_tokens_total': ascii_arr.sum().item(),
+                'braille_tokens_total': braille_arr.sum().item(),
+                'ascii_tokens_std': float(ascii_arr.std(ddof=1)) if ascii_arr.size > 1 else 0,
+                'braille_tokens_std': float(braille_arr.std(ddof=1)) if braille_arr.size > 1 else 0,
             }
         )
         
@@ -198,6 +361,94 @@ class BrailleCodeExperiment:
         self.results.append(result)
         return result
         
+    def _token_counts(self) -> Tuple[List[float], List[float]]:
+        """Token counts for every sample, also stored on the samples"""
+        if not self.tokenizers:
+            # Fallback: estimate tokens as chars/4
+            ascii_tokens = []
+            braille_tokens = []
+            
+            for sample in self.samples:
+                ascii_tok = len(sample.ascii_code) / 4
+                braille_tok = len(sample.braille_code) / 4
+                ascii_tokens.append(ascii_tok)
+                braille_tokens.append(braille_tok)
+                sample.ascii_tokens = int(ascii_tok)
+                sample.braille_tokens = int(braille_tok)
+        else:
+            name = 'gpt2' if 'gpt2' in self.tokenizers else next(iter(self.tokenizers))
+            tokenizer = self.tokenizers[name]
+            count_key = f"{name}_tokens"
+            
+            # Only tokenize samples whose counts aren't cached from a prior run
+            with self._open_cache() as cache:
+                entries = [cache.get(s.content_hash, {}) for s in self.samples]
+                missing = [i for i, e in enumerate(entries) if count_key not in e]
+                
+                if missing:
+                    ascii_counts, braille_counts = self._count_tokens(
+                        tokenizer, [self.samples[i] for i in missing]
+                    )
+                    for i, a, b in zip(missing, ascii_counts, braille_counts):
+                        entries[i][count_key] = (a, b)
+                        cache[self.samples[i].content_hash] = entries[i]
+            
+            ascii_tokens = [e[count_key][0] for e in entries]
+            braille_tokens = [e[count_key][1] for e in entries]
+            
+            for sample, ascii_tok, braille_tok in zip(self.samples, ascii_tokens, braille_tokens):
+                sample.ascii_tokens = ascii_tok
+                sample.braille_tokens = braille_tok
+                
+        return ascii_tokens, braille_tokens
+        
+    def _compute_per_sample_stats(self) -> Dict[str, np.ndarray]:
+        """
+        Per-sample metrics shared by experiments 1, 2, 3 and 5.
+        
+        Lengths, charset sizes, zlib ratios and token counts are gathered in
+        one pass into parallel arrays, so each experiment is a few reductions
+        instead of another walk over every sample.
+        """
+        if self._stats is not None and len(self._stats['ascii_len']) == len(self.samples):
+            return self._stats
+        
+        n = len(self.samples)
+        stats = {key: np.empty(n, dtype=np.float64)
+                 for key in ('ascii_len', 'braille_len', 'ascii_unique', 'braille_unique')}
+        for i, sample in enumerate(self.samples):
+            stats['ascii_len'][i] = len(sample.ascii_code)
+            stats['braille_len'][i] = len(sample.braille_code)
+            stats['ascii_unique'][i] = sample.ascii_unique
+            stats['braille_unique'][i] = sample.braille_unique
+        
+        # zlib releases the GIL while compressing, so threads use all cores
+        pairs = [(s.ascii_bytes, s.braille_bytes) for s in self.samples]
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            ratios = np.asarray(list(executor.map(_compress_pair, pairs)),
+                                dtype=np.float64).reshape(-1, 2)
+        stats['ascii_zlib'] = ratios[:, 0]
+        stats['braille_zlib'] = ratios[:, 1]
+        
+        ascii_tokens, braille_tokens = self._token_counts()
+        stats['ascii_toks'] = np.asarray(ascii_tokens)
+        stats['braille_toks'] = np.asarray(braille_tokens)
+        
+        self._stats = stats
+        return stats
+        
+    def _count_tokens(self, tokenizer, samples: List[CodeSample]) -> Tuple[List[int], List[int]]:
+        """Token counts for the ASCII and braille form of each sample."""
+        if getattr(tokenizer, 'is_fast', False):
+            # Rust tokenizer: one batched call per encoding instead of
+            # one FFI round-trip per sample
+            ascii_ids = tokenizer([s.ascii_code for s in samples])['input_ids']
+            braille_ids = tokenizer([s.braille_code for s in samples])['input_ids']
+            return [len(ids) for ids in ascii_ids], [len(ids) for ids in braille_ids]
+        
+        return ([len(tokenizer.encode(s.ascii_code)) for s in samples],
+                [len(tokenizer.encode(s.braille_code)) for s in samples])
+        
     def experiment_2_semantic_density(self) -> ExperimentResult:
         """
         H2: Braille-encoded context can hold more semantic information
@@ -208,25 +459,20 @@ class BrailleCodeExperiment:
         print("EXPERIMENT 2: Semantic Density")
         print("="*60)
         
-        ascii_densities = []
-        braille_densities = []
-        
-        for sample in self.samples:
-            # ASCII: count unique characters / total
-            ascii_unique = len(set(sample.ascii_code))
-            ascii_total = len(sample.ascii_code)
-            ascii_density = ascii_unique / ascii_total if ascii_total > 0 else 0
-            
-            # Braille: count unique braille chars / total
-            braille_unique = len(set(sample.braille_code))
-            braille_total = len(sample.braille_code)
-            braille_density = braille_unique / braille_total if braille_total > 0 else 0
-            
-            ascii_densities.append(ascii_density)
-            braille_densities.append(braille_density)
+        stats = self._compute_per_sample_stats()
+        ascii_charset_sizes = stats['ascii_unique']
+        braille_charset_sizes = stats['braille_unique']
+        ascii_totals = stats['ascii_len']
+        braille_totals = stats['braille_len']
+        
+        # unique symbols / total chars, 0 for empty samples
+        ascii_densities = np.divide(ascii_charset_sizes, ascii_totals,
+                                    out=np.zeros_like(ascii_totals), where=ascii_totals > 0)
+        braille_densities = np.divide(braille_charset_sizes, braille_totals,
+                                      out=np.zeros_like(braille_totals), where=braille_totals > 0)
             
-        avg_ascii = statistics.mean(ascii_densities)
-        avg_braille = statistics.mean(braille_densities)
+        avg_ascii = float(ascii_densities.mean())
+        avg_braille = float(braille_densities.mean())
         ratio = avg_braille / avg_ascii if avg_ascii > 0 else 1
         
         result = ExperimentResult(
@@ -236,8 +482,8 @@ class BrailleCodeExperiment:
             improvement_ratio=ratio,
             sample_size=len(self.samples),
             details={
-                'ascii_charset_avg': statistics.mean([len(set(s.ascii_code)) for s in self.samples]),
-                'braille_charset_avg': statistics.mean([len(set(s.braille_code)) for s in self.samples]),
+                'ascii_charset_avg': float(ascii_charset_sizes.mean()),
+                'braille_charset_avg': float(braille_charset_sizes.mean()),
             }
         )
         
@@ -257,27 +503,10 @@ class BrailleCodeExperiment:
         print("EXPERIMENT 3: Compression Ratio")
         print("="*60)
         
-        import zlib
-        
-        ascii_ratios = []
-        braille_ratios = []
-        
-        for sample in self.samples:
-            # Compress ASCII
-            ascii_bytes = sample.ascii_code.encode('utf-8')
-            ascii_compressed = zlib.compress(ascii_bytes)
-            ascii_ratio = len(ascii_compressed) / len(ascii_bytes)
+        stats = self._compute_per_sample_stats()
             
-            # Compress Braille
-            braille_bytes = sample.braille_code.encode('utf-8')
-            braille_compressed = zlib.compress(braille_bytes)
-            braille_ratio = len(braille_compressed) / len(braille_bytes)
-            
-            ascii_ratios.append(ascii_ratio)
-            braille_ratios.append(braille_ratio)
-            
-        avg_ascii = statistics.mean(ascii_ratios)
-        avg_braille = statistics.mean(braille_ratios)
+        avg_ascii = float(stats['ascii_zlib'].mean())
+        avg_braille = float(stats['braille_zlib'].mean())
         ratio = avg_braille / avg_ascii
         
         result = ExperimentResult(
@@ -288,6 +517,7 @@ class BrailleCodeExperiment:
             sample_size=len(self.samples),
             details={
                 'interpretation': 'Lower is better (more compressible = more redundancy)',
+                'zlib_level': COMPRESSION_LEVEL,
             }
         )
         
@@ -308,26 +538,17 @@ class BrailleCodeExperiment:
         print("EXPERIMENT 4: Pattern Frequency (N-grams)")
         print("="*60)
         
-        def count_ngrams(text: str, n: int) -> Counter:
-            return Counter(text[i:i+n] for i in range(len(text) - n + 1))
-        
         ascii_pattern_counts = []
         braille_pattern_counts = []
         
         for sample in self.samples:
-            # Count 3-grams (common pattern length)
-            ascii_ngrams = count_ngrams(sample.ascii_code, 3)
-            braille_ngrams = count_ngrams(sample.braille_code, 3)
+            # Count 3-grams (common pattern length) that appear 3+ times
+            # (meaningful patterns)
+            ascii_pattern_counts.append(count_repeated_ngrams(sample.ascii_code, 3))
+            braille_pattern_counts.append(count_repeated_ngrams(sample.braille_code, 3))
             
-            # Count patterns that appear 3+ times (meaningful patterns)
-            ascii_patterns = sum(1 for c in ascii_ngrams.values() if c >= 3)
-            braille_patterns = sum(1 for c in braille_ngrams.values() if c >= 3)
-            
-            ascii_pattern_counts.append(ascii_patterns)
-            braille_pattern_counts.append(braille_patterns)
-            
-        avg_ascii = statistics.mean(ascii_pattern_counts)
-        avg_braille = statistics.mean(braille_pattern_counts)
+        avg_ascii = float(np.mean(ascii_pattern_counts))
+        avg_braille = float(np.mean(braille_pattern_counts))
         ratio = avg_braille / avg_ascii if avg_ascii > 0 else 1
         
         result = ExperimentResult(
@@ -360,23 +581,16 @@ class BrailleCodeExperiment:
         print("EXPERIMENT 5: Bit Space Utilization")
         print("="*60)
         
-        ascii_utilizations = []
-        braille_utilizations = []
+        stats = self._compute_per_sample_stats()
         
-        for sample in self.samples:
-            # ASCII: unique chars / 128 possible
-            ascii_unique = len(set(sample.ascii_code))
-            ascii_util = ascii_unique / 128
-            
-            # Braille: unique chars / 256 possible  
-            braille_unique = len(set(sample.braille_code))
-            braille_util = braille_unique / 256
-            
-            ascii_utilizations.append(ascii_util)
-            braille_utilizations.append(braille_util)
+        # ASCII: unique chars / 128 possible
+        ascii_utilizations = stats['ascii_unique'] / 128
+        
+        # Braille: unique chars / 256 possible  
+        braille_utilizations = stats['braille_unique'] / 256
             
-        avg_ascii = statistics.mean(ascii_utilizations)
-        avg_braille = statistics.mean(braille_utilizations)
+        avg_ascii = float(ascii_utilizations.mean())
+        avg_braille = float(braille_utilizations.mean())
         
         # For this metric, we want to measure effective use
         # ASCII wastes ~90 chars, braille uses the full 256
@@ -417,35 +631,29 @@ class BrailleCodeExperiment:
         print("="*60)
         
         # Analyze how dot 7 and dot 8 correlate with code structure
-        dot7_keywords = 0  # Upper dots for keywords
-        dot8_numbers = 0   # Lower dots for numbers
-        total_braille = 0
-        
-        keywords = {'def', 'class', 'if', 'else', 'for', 'while', 'return', 
-                    'import', 'from', 'try', 'except', 'with', 'as', 'in',
-                    'and', 'or', 'not', 'True', 'False', 'None', 'async', 'await'}
+        is_keyword = _PY_KEYWORDS.__contains__
         
+        # Reuse the already-encoded braille words; no encoder calls needed
+        keyword_words = []
+        number_words = []
         for sample in self.samples:
-            words = sample.ascii_code.split()
-            for i, word in enumerate(words):
-                if word in keywords:
-                    # Check if braille encoding uses dot 7
-                    braille_word = self.encoder.encode(word)
-                    for char in braille_word:
-                        if ord(char) >= 0x2800:
-                            dots = ord(char) - 0x2800
-                            if dots & 0x40:  # Dot 7
-                                dot7_keywords += 1
-                            total_braille += 1
-                            
+            for word, braille_word in sample.word_pairs:
+                if is_keyword(word):
+                    keyword_words.append(braille_word)
                 if word.isdigit():
-                    braille_word = self.encoder.encode(word)
-                    for char in braille_word:
-                        if ord(char) >= 0x2800:
-                            dots = ord(char) - 0x2800
-                            if dots & 0x80:  # Dot 8
-                                dot8_numbers += 1
-                            total_braille += 1
+                    number_words.append(braille_word)
+        
+        def braille_dots(braille_words: List[str]) -> np.ndarray:
+            braille = ''.join(braille_words)
+            cp = np.frombuffer(braille.encode('utf-32-le'), dtype=np.uint32)
+            return cp[cp >= 0x2800] - 0x2800
+        
+        keyword_dots = braille_dots(keyword_words)
+        number_dots = braille_dots(number_words)
+        
+        dot7_keywords = int(np.count_nonzero(keyword_dots & 0x40))  # Upper dots for keywords
+        dot8_numbers = int(np.count_nonzero(number_dots & 0x80))    # Lower dots for numbers
+        total_braille = len(keyword_dots) + len(number_dots)
                             
         keyword_ratio = dot7_keywords / total_braille if total_braille > 0 else 0
         number_ratio = dot8_numbers / total_braille if total_braille > 0 else 0
@@ -582,8 +790,16 @@ class BrailleCodeExperiment:
             ]
         }
         
-        with open(output_path, 'w') as f:
-            json.dump(summary, f, indent=2)
+        summary = _finite_for_json(summary)
+        
+        if HAS_ORJSON:
+            Path(output_path).write_bytes(orjson.dumps(
+                summary,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            ))
+        else:
+            with open(output_path, 'w') as f:
+                json.dump(summary, f, indent=2, allow_nan=False)
             
         print(f"\nResults saved to: {output_path}")
         return output_path
@@ -15,11 +15,11 @@ Author: Ryan Barrett
 """
 
 import argparse
-import os
+import asyncio
 import sys
-from typing import List
+from typing import List, Optional
 
-from dotflow_search import DotFlowSearch
+from dotflow_search import DotFlowSearch, HAS_FAISS
 
 
 # Curated list of diverse YouTube videos for indexing
@@ -41,14 +41,37 @@ SAMPLE_VIDEOS = [
     ("V1bFr2SWP1I", "Ocean Waves"),
 ]
 
+# Sub-linear FAISS lookups once many videos are indexed; the SQL
+# candidate cascade when faiss isn't installed
+DEFAULT_INDEX_TYPE = 'ivfpq' if HAS_FAISS else 'sql'
+
+# Downloads in flight at once while building the index
+MAX_CONCURRENT_DOWNLOADS = 4
+
+# Rate audio is decoded at for both indexing and search queries, so
+# index and query fingerprints always see the same spectrum
+SAMPLE_RATE = 22050
+
 
 class LiveAudioSearchSystem:
     """
     Complete system for indexing and searching YouTube audio.
     """
     
-    def __init__(self, db_path: str = "live_audio.db"):
-        self.search = DotFlowSearch(db_path=db_path)
+    def __init__(self, db_path: str = "live_audio.db",
+                 index_type: str = DEFAULT_INDEX_TYPE,
+                 workers: Optional[int] = None):
+        """
+        Args:
+            db_path: SQLite database for indexed chunks
+            index_type: 'ivfpq', 'hnsw', 'flat' or 'binary' FAISS candidate index,
+                or 'sql' for the SQL candidate cascade
+            workers: Fingerprinting processes (default: one per CPU)
+        """
+        self.search = DotFlowSearch(
+            db_path=db_path, workers=workers,
+            ann_index=None if index_type == 'sql' else index_type
+        )
     
     def build_index(self, videos: List[tuple] = None, 
                     max_duration: int = 60) -> int:
@@ -69,54 +92,13 @@ class LiveAudioSearchSystem:
         print("  📥 BUILDING LIVE AUDIO INDEX")
         print("=" * 60)
         
-        total_chunks = 0
-        successful = 0
+        results = asyncio.run(self._index_all(videos, max_duration))
+        total_chunks = sum(chunks for chunks in results if chunks is not None)
+        successful = sum(1 for chunks in results if chunks is not None)
         
-        for video_id, title in videos:
-            url = f"https://youtube.com/watch?v={video_id}"
-            print(f"\n📹 Indexing: {title}")
-            print(f"   URL: {url}")
-            
-            try:
-                # Index only first segment to save time/bandwidth
-                from youtube_fingerprint import YouTubeFingerprint
-                import wave
-                import struct
-                import tempfile
-                
-                yt = YouTubeFingerprint(keep_audio=True)
-                
-                # Download
-                audio_path = yt.download_audio(url)
-                
-                # Trim to max_duration
-                trimmed_path = f"{tempfile.gettempdir()}/trimmed_{video_id}.wav"
-                
-                with wave.open(audio_path, 'rb') as src:
-                    params = src.getparams()
-                    max_frames = min(src.getnframes(), 
-                                    max_duration * src.getframerate())
-                    data = src.readframes(max_frames)
-                
-                with wave.open(trimmed_path, 'wb') as dst:
-                    dst.setparams(params)
-                    dst.writeframes(data)
-                
-                # Index
-                chunks = self.search.index_audio_file(
-                    trimmed_path, video_id, title, url
-                )
-                total_chunks += chunks
-                successful += 1
-                
-                # Cleanup
-                os.remove(audio_path)
-                os.remove(trimmed_path)
-                
-                print(f"   ✅ Indexed {chunks} chunks")
-                
-            except Exception as e:
-                print(f"   ❌ Failed: {e}")
+        # Train and fill the ANN index once over every chunk
+        if self.search.ann_index is not None:
+            self.search.build_ann_index()
         
         print(f"\n{'=' * 60}")
         print(f"  📊 INDEX COMPLETE")
@@ -126,48 +108,65 @@ class LiveAudioSearchSystem:
         
         return total_chunks
     
+    async def _index_all(self, videos: List[tuple],
+                         max_duration: int) -> List[Optional[int]]:
+        """Index videos with overlapping downloads; chunks per video or None."""
+        sem = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+        return await asyncio.gather(*[
+            self._index_one(video_id, title, max_duration, sem)
+            for video_id, title in videos
+        ])
+    
+    async def _index_one(self, video_id: str, title: str, max_duration: int,
+                         sem: asyncio.Semaphore) -> Optional[int]:
+        """Decode one video in a worker thread, then index it."""
+        from youtube_fingerprint import YouTubeFingerprint
+        
+        url = f"https://youtube.com/watch?v={video_id}"
+        print(f"\n📹 Indexing: {title}")
+        print(f"   URL: {url}")
+        
+        try:
+            yt = YouTubeFingerprint(keep_audio=True)
+            
+            # Download and decode (network-bound, so several run at once).
+            # Only the first segment is decoded to save time/bandwidth, and
+            # ffmpeg pipes it straight into memory, no WAV is written
+            async with sem:
+                samples = await asyncio.get_running_loop().run_in_executor(
+                    None, yt.download_audio_np, url, SAMPLE_RATE, max_duration
+                )
+            
+            # Index on the event loop thread, one video at a time, so the
+            # database is only ever written from here
+            chunks = self.search.index_audio_array(
+                samples, SAMPLE_RATE, video_id, title, url
+            )
+            
+            print(f"   ✅ Indexed {chunks} chunks ({title})")
+            return chunks
+            
+        except Exception as e:
+            print(f"   ❌ Failed ({title}): {e}")
+            return None
+    
     def search_youtube(self, url: str, segment_start: int = 0,
                        segment_duration: int = 10) -> None:
         """Search using audio from a YouTube video."""
         from youtube_fingerprint import YouTubeFingerprint
-        import wave
-        import struct
         
         print(f"\n🔍 Searching with: {url}")
         print(f"   Segment: {segment_start}s to {segment_start + segment_duration}s")
         
-        yt = YouTubeFingerprint(keep_audio=True)
-        audio_path = yt.download_audio(url)
+        yt = YouTubeFingerprint()
+        samples = yt.download_audio_np(url, SAMPLE_RATE, segment_duration,
+                                       start_time=segment_start)
         
-        try:
-            with wave.open(audio_path, 'rb') as wav:
-                sample_rate = wav.getframerate()
-                n_channels = wav.getnchannels()
-                sample_width = wav.getsampwidth()
-                
-                # Seek to segment
-                start_frame = segment_start * sample_rate
-                wav.setpos(min(start_frame, wav.getnframes() - 1))
-                
-                # Read segment
-                n_frames = min(segment_duration * sample_rate,
-                              wav.getnframes() - start_frame)
-                raw_data = wav.readframes(n_frames)
-            
-            # Convert to samples
-            samples = self.search._bytes_to_samples(
-                raw_data, sample_width, n_channels
-            )
-            
-            # Search
-            results = self.search.search(samples, sample_rate, 
-                                         top_k=5, min_similarity=0.3)
-            
-            print(self.search.format_results(results))
-            
-        finally:
-            if os.path.exists(audio_path):
-                os.remove(audio_path)
+        # Search
+        results = self.search.search(samples, SAMPLE_RATE, 
+                                     top_k=5, min_similarity=0.3)
+        
+        print(self.search.format_results(results))
     
     def interactive_demo(self):
         """Run interactive demonstration."""
@@ -230,10 +229,17 @@ Examples:
                         help='Duration for search segment')
     parser.add_argument('--max-index-duration', type=int, default=60,
                         help='Max seconds to index per video')
+    parser.add_argument('--index-type', default=DEFAULT_INDEX_TYPE,
+                        choices=[*DotFlowSearch.ANN_INDEX_TYPES, 'sql'],
+                        help='Candidate index: ivfpq (compact), hnsw (high recall), '
+                             'flat (exact), binary (dot-bit Hamming) or sql (no faiss)')
+    parser.add_argument('--parallel', type=int, default=None, metavar='N',
+                        help='Fingerprinting processes (default: one per CPU)')
     
     args = parser.parse_args()
     
-    system = LiveAudioSearchSystem(db_path=args.db)
+    system = LiveAudioSearchSystem(db_path=args.db, index_type=args.index_type,
+                                   workers=args.parallel)
     
     if args.command == 'build':
         system.build_index(max_duration=args.max_index_duration)
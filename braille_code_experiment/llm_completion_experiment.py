@@ -10,24 +10,45 @@ Compare completion quality when prompting with ASCII vs Braille context.
 import os
 import sys
 import json
+import re
 import time
 import random
 import asyncio
+import argparse
+import hashlib
+import shelve
+import pickle
 import httpx
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional, FrozenSet
 from dataclasses import dataclass
-import statistics
+
+import numpy as np
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from braille8_core import Braille8Encoder
 
+try:
+    import h2  # noqa: F401  (enables httpx HTTP/2)
+    HAS_H2 = True
+except ImportError:
+    HAS_H2 = False
+
+# Completions keyed by hash of model + max_tokens + prompt, reused across runs
+CACHE_PATH = Path.home() / ".cache" / "sal-voice" / "llm_completion_cache"
+
+# Extracted (context, expected) snippets, reused while the code tree is unchanged
+SNIPPET_CACHE_PATH = Path.home() / ".cache" / "sal-voice" / "llm_snippets.pkl"
+
 
 @dataclass
 class CompletionTest:
     """A single completion test case"""
     context: str
     expected: str
+    braille_context: str = ""
     ascii_prediction: str = ""
     braille_prediction: str = ""
     ascii_exact: bool = False
@@ -36,34 +57,176 @@ class CompletionTest:
     braille_similarity: float = 0.0
 
 
+@lru_cache(maxsize=4096)
+def _normalize(s: str) -> Tuple[str, FrozenSet[str]]:
+    """Whitespace-normalized string and its token set, computed once per string"""
+    tokens = s.split()
+    return ' '.join(tokens), frozenset(tokens)
+
+
 def calculate_similarity(s1: str, s2: str) -> float:
     """Calculate string similarity (0-1)"""
     if not s1 or not s2:
         return 0.0
     
     # Normalize whitespace
-    s1 = ' '.join(s1.split())
-    s2 = ' '.join(s2.split())
+    s1, tokens1 = _normalize(s1)
+    s2, tokens2 = _normalize(s2)
     
     # Exact match
-    if s1.strip() == s2.strip():
+    if s1 == s2:
         return 1.0
     
     # Check if expected is contained in prediction
-    if s2.strip() in s1:
+    if s2 in s1:
         return 0.9
         
     # Token overlap
-    tokens1 = set(s1.split())
-    tokens2 = set(s2.split())
-    
     if not tokens1 or not tokens2:
         return 0.0
-        
-    intersection = tokens1 & tokens2
-    union = tokens1 | tokens2
     
-    return len(intersection) / len(union)
+    return len(tokens1 & tokens2) / len(tokens1 | tokens2)
+
+
+def calculate_similarity_batch(predictions: List[str], expecteds: List[str]) -> np.ndarray:
+    """calculate_similarity for each (prediction, expected) pair"""
+    return np.fromiter(map(calculate_similarity, predictions, expecteds),
+                       dtype=np.float64, count=len(predictions))
+
+
+# Snippets collected per requested test before the file scan stops
+SNIPPET_OVERSAMPLE = 4
+
+
+def _extract_defs(code: str) -> List[Tuple[str, str]]:
+    """(context, expected) pairs for each function definition in a source file"""
+    snippets = []
+    lines = code.split('\n')
+    for i, line in enumerate(lines):
+        if line.strip().startswith('def ') and i + 5 < len(lines):
+            # Get function signature + first few lines
+            context = '\n'.join(lines[max(0, i-2):i+3])
+            expected = lines[i+3].strip() if i+3 < len(lines) else ""
+            if context and expected and len(expected) > 5:
+                snippets.append((context, expected))
+    return snippets
+
+
+# Literal searched for in raw file bytes to find candidate def lines
+_DEF_RE = re.compile(rb'def ')
+
+
+def _is_utf8(raw: bytes) -> bool:
+    """Whether raw decodes as UTF-8 without dropping anything"""
+    try:
+        raw.decode('utf-8')
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def _extract_defs_bytes(raw: bytes) -> List[Tuple[str, str]]:
+    """
+    _extract_defs on undecoded file contents.
+    
+    A C-level scan for b'def ' finds candidate lines; only the text before
+    each hit and the six-line window around real def lines are decoded,
+    instead of decoding, splitting and stripping every line of the file.
+    """
+    if b'\r' in raw or not (raw.isascii() or _is_utf8(raw)):
+        # Text mode would translate \r newlines, and errors='ignore' can
+        # splice text across invalid bytes (b'def\xff ' reads as 'def ');
+        # take the decoded path for both
+        code = raw.decode('utf-8', errors='ignore')
+        return _extract_defs(code.replace('\r\n', '\n').replace('\r', '\n'))
+    
+    snippets = []
+    n_lines = raw.count(b'\n') + 1
+    line_no = pos = 0
+    for m in _DEF_RE.finditer(raw):
+        start = raw.rfind(b'\n', 0, m.start()) + 1
+        end = raw.find(b'\n', m.end())
+        # Same test as line.strip().startswith('def '): only whitespace
+        # before the hit, and something other than whitespace after it
+        if (raw[start:m.start()].decode('utf-8', errors='ignore').strip()
+                or not raw[m.end():end if end >= 0 else len(raw)]
+                       .decode('utf-8', errors='ignore').strip()):
+            continue
+        
+        line_no += raw.count(b'\n', pos, start)
+        pos = start
+        if line_no + 5 >= n_lines:
+            break
+        
+        # Lines line_no-2 .. line_no+3 (fewer before near the top)
+        before = min(line_no, 2)
+        lo = start
+        for _ in range(before):
+            lo = raw.rfind(b'\n', 0, lo - 1) + 1
+        hi = start
+        for _ in range(4):
+            hi = raw.index(b'\n', hi) + 1
+        window = raw[lo:hi - 1].decode('utf-8', errors='ignore').split('\n')
+        
+        # Get function signature + first few lines
+        context = '\n'.join(window[:before + 3])
+        expected = window[before + 3].strip()
+        if context and expected and len(expected) > 5:
+            snippets.append((context, expected))
+    return snippets
+
+
+# Directories never descended into when collecting source files
+_PRUNE_DIRS = frozenset({
+    '.git', 'node_modules', '__pycache__', '.venv', 'venv', 'dist', 'build',
+})
+
+
+def _iter_py(root: Path):
+    """Python files under root, without walking pruned directories"""
+    for dirpath, dirs, files in os.walk(root):
+        dirs[:] = [d for d in dirs if d not in _PRUNE_DIRS]
+        for name in files:
+            if name.endswith('.py'):
+                yield Path(dirpath, name)
+
+
+def _mtime(path: Path) -> float:
+    """File mtime, or 0 for files that vanished or cannot be stat'ed"""
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+def _load_snippets(sig: tuple) -> Optional[List[Tuple[str, str]]]:
+    """Cached snippet list if it was built for the same corpus signature"""
+    try:
+        with open(SNIPPET_CACHE_PATH, 'rb') as f:
+            cached = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
+    if not isinstance(cached, dict) or cached.get('sig') != sig:
+        return None
+    return cached.get('data')
+
+
+def _save_snippets(sig: tuple, snippets: List[Tuple[str, str]]):
+    """Store the snippet list together with its corpus signature"""
+    try:
+        SNIPPET_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(SNIPPET_CACHE_PATH, 'wb') as f:
+            pickle.dump({'sig': sig, 'data': snippets}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+
+
+def _scan_file(filepath: Path) -> List[Tuple[str, str]]:
+    """Extract snippets from one file; unreadable files yield none"""
+    try:
+        return _extract_defs_bytes(filepath.read_bytes())
+    except OSError:
+        return []
 
 
 class LLMCompletionExperiment:
@@ -75,61 +238,133 @@ class LLMCompletionExperiment:
     256-character encoding space.
     """
     
-    def __init__(self, model: str = "sal:latest"):
+    # Completions in flight at once; matches Ollama's default num_parallel
+    MAX_CONCURRENT_REQUESTS = 4
+    
+    # How long Ollama keeps the model loaded after each request
+    KEEP_ALIVE = "10m"
+    
+    def __init__(self, model: str = "sal:latest", use_cache: bool = True):
         self.model = model
         self.encoder = Braille8Encoder()
         self.ollama_url = "http://localhost:11434/api/generate"
         
-    async def complete_async(self, prompt: str, max_tokens: int = 50) -> str:
-        """Get completion from Ollama"""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                response = await client.post(
-                    self.ollama_url,
-                    json={
-                        "model": self.model,
-                        "prompt": prompt,
-                        "stream": False,
-                        "options": {
-                            "num_predict": max_tokens,
-                            "temperature": 0.1,  # Low temp for deterministic completion
-                        }
+        # Shared keep-alive client, created on first use inside the event loop
+        self._client: Optional[httpx.AsyncClient] = None
+        
+        self._cache = None
+        if use_cache:
+            CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            self._cache = shelve.open(str(CACHE_PATH))
+            
+    def close(self):
+        """Close the completion cache"""
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
+            
+    def _http(self) -> httpx.AsyncClient:
+        """Client reused for every Ollama request until aclose()"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=60.0,
+                http2=HAS_H2,
+                limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+            )
+        return self._client
+        
+    async def aclose(self):
+        """Close the shared HTTP client (must run in the loop that used it)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            
+    async def _run_and_aclose(self, coro):
+        """Await `coro`, then close the client before its event loop ends"""
+        try:
+            return await coro
+        finally:
+            await self.aclose()
+            
+    def _cache_key(self, prompt: str, max_tokens: int) -> str:
+        return hashlib.blake2b(
+            f"{self.model}|{max_tokens}|{prompt}".encode('utf-8'), digest_size=16
+        ).hexdigest()
+        
+    async def complete_async(self, prompt: str, max_tokens: int = 50,
+                             client: Optional[httpx.AsyncClient] = None) -> str:
+        """Get completion from Ollama, on `client` or the shared client"""
+        key = self._cache_key(prompt, max_tokens)
+        if self._cache is not None and key in self._cache:
+            return self._cache[key]
+            
+        if client is None:
+            client = self._http()
+        
+        try:
+            response = await client.post(
+                self.ollama_url,
+                json={
+                    "model": self.model,
+                    "prompt": prompt,
+                    "stream": False,
+                    "keep_alive": self.KEEP_ALIVE,
+                    "options": {
+                        "num_predict": max_tokens,
+                        "temperature": 0.1,  # Low temp for deterministic completion
                     }
-                )
-                data = response.json()
-                return data.get('response', '')
-            except Exception as e:
-                print(f"Error: {e}")
-                return ""
+                }
+            )
+            # HTTP errors (e.g. 404 for a missing model) carry a JSON
+            # body too; they must fail here rather than cache an empty reply
+            response.raise_for_status()
+            data = response.json()
+            if 'error' in data:
+                raise RuntimeError(data['error'])
+            completion = data.get('response', '')
+        except Exception as e:
+            print(f"Error: {e}")
+            return ""
+            
+        # Failed requests aren't cached, so a re-run retries them
+        if self._cache is not None:
+            self._cache[key] = completion
+            self._cache.sync()
+        return completion
                 
     def complete(self, prompt: str, max_tokens: int = 50) -> str:
         """Sync wrapper for completion"""
-        return asyncio.run(self.complete_async(prompt, max_tokens))
+        return asyncio.run(self._run_and_aclose(self.complete_async(prompt, max_tokens)))
         
-    def create_test_cases(self, code_dir: str = None, num_tests: int = 20) -> List[CompletionTest]:
-        """Create test cases from real code"""
+    def create_test_cases(self, code_dir: str = None, num_tests: int = 20,
+                          refresh: bool = False) -> List[CompletionTest]:
+        """Create test cases from real code (snippets cached until the tree changes)"""
         code_dir = Path(code_dir) if code_dir else Path.home() / "sal-voice"
         tests = []
         
-        # Collect code snippets
-        snippets = []
-        for ext in ['.py']:
-            for filepath in code_dir.rglob(f"*{ext}"):
-                if '.git' in str(filepath) or 'node_modules' in str(filepath):
-                    continue
-                try:
-                    code = filepath.read_text(encoding='utf-8', errors='ignore')
-                    # Extract function definitions
-                    lines = code.split('\n')
-                    for i, line in enumerate(lines):
-                        if line.strip().startswith('def ') and i + 5 < len(lines):
-                            # Get function signature + first few lines
-                            context = '\n'.join(lines[max(0, i-2):i+3])
-                            expected = lines[i+3].strip() if i+3 < len(lines) else ""
-                            if context and expected and len(expected) > 5:
-                                snippets.append((context, expected))
-                except:
-                    continue
+        paths = list(_iter_py(code_dir))
+        
+        # Snippets only change when files are added, removed or modified.
+        # The cutoff is part of the key since the scan stops early
+        limit = num_tests * SNIPPET_OVERSAMPLE
+        sig = (str(code_dir.resolve()), len(paths),
+               max((_mtime(p) for p in paths), default=0.0), limit)
+        snippets = None if refresh else _load_snippets(sig)
+        
+        if snippets is None:
+            # Collect code snippets. Reads release the GIL, so scan files on a
+            # thread pool; map() keeps path order
+            snippets = []
+            executor = ThreadPoolExecutor(max_workers=32)
+            try:
+                for found in executor.map(_scan_file, paths):
+                    snippets.extend(found)
+                    if len(snippets) >= limit:
+                        break
+            finally:
+                # Enough to sample from: skip reading the remaining files
+                executor.shutdown(cancel_futures=True)
+            _save_snippets(sig, snippets)
                     
         # Sample test cases
         random.shuffle(snippets)
@@ -139,7 +374,41 @@ class LLMCompletionExperiment:
         print(f"Created {len(tests)} test cases")
         return tests
         
-    def run_experiment(self, num_tests: int = 15) -> Dict:
+    async def warmup(self):
+        """Load the model into Ollama (an empty prompt only loads it)"""
+        try:
+            await self._http().post(
+                self.ollama_url,
+                json={"model": self.model, "keep_alive": self.KEEP_ALIVE},
+            )
+        except Exception as e:
+            print(f"Warmup error: {e}")
+            
+    async def complete_all(self, requests: List[Tuple[str, int]]) -> List[str]:
+        """
+        Complete (prompt, max_tokens) pairs concurrently on the shared client.
+        
+        At most MAX_CONCURRENT_REQUESTS are in flight; results come back
+        in request order.
+        """
+        sem = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        client = self._http()
+        
+        async def one(prompt: str, max_tokens: int) -> str:
+            async with sem:
+                return await self.complete_async(prompt, max_tokens, client)
+        
+        return await asyncio.gather(*[one(p, n) for p, n in requests])
+        
+    def run_experiment(self, num_tests: int = 15, refresh_corpus: bool = False,
+                       warmup: bool = False) -> Dict:
+        """Run the LLM completion experiment (sync entry point)"""
+        return asyncio.run(self._run_and_aclose(
+            self.run_experiment_async(num_tests, refresh_corpus, warmup)))
+        
+    async def run_experiment_async(self, num_tests: int = 15,
+                                   refresh_corpus: bool = False,
+                                   warmup: bool = False) -> Dict:
         """Run the LLM completion experiment"""
         print("\n" + "="*70)
         print("LLM CODE COMPLETION EXPERIMENT")
@@ -147,7 +416,7 @@ class LLMCompletionExperiment:
         print("="*70)
         
         # Create test cases
-        tests = self.create_test_cases(num_tests=num_tests)
+        tests = self.create_test_cases(num_tests=num_tests, refresh=refresh_corpus)
         
         if not tests:
             print("No test cases found!")
@@ -155,12 +424,15 @@ class LLMCompletionExperiment:
             
         print(f"\nRunning {len(tests)} completion tests...")
         
-        ascii_similarities = []
-        braille_similarities = []
+        # Encode each distinct context once, before any network calls
+        contexts = {test.context for test in tests}
+        encoded = dict(zip(contexts, map(self.encoder.encode, contexts)))
+        for test in tests:
+            test.braille_context = encoded[test.context]
         
-        for i, test in enumerate(tests):
-            print(f"\nTest {i+1}/{len(tests)}")
-            
+        # Build every prompt up front and issue them concurrently
+        requests = []
+        for test in tests:
             # ASCII completion
             ascii_prompt = f"""Complete the next line of this Python code:
 
@@ -168,30 +440,46 @@ class LLMCompletionExperiment:
 
 Next line:"""
             
-            test.ascii_prediction = self.complete(ascii_prompt, max_tokens=30)
-            test.ascii_similarity = calculate_similarity(test.ascii_prediction, test.expected)
-            test.ascii_exact = test.ascii_prediction.strip() == test.expected.strip()
-            
-            # Braille completion - encode context to braille
-            braille_context = self.encoder.encode(test.context)
+            # Braille completion - context pre-encoded to braille
             braille_prompt = f"""Complete the next line of this code (written in 8-dot braille):
 
-{braille_context}
+{test.braille_context}
 
 Next line (in braille):"""
             
-            braille_response = self.complete(braille_prompt, max_tokens=50)
-            # Decode braille response back to ASCII for comparison
-            try:
-                test.braille_prediction = self.encoder.decode(braille_response) if braille_response else ""
-            except:
-                test.braille_prediction = braille_response
-                
-            test.braille_similarity = calculate_similarity(test.braille_prediction, test.expected)
-            test.braille_exact = test.braille_prediction.strip() == test.expected.strip()
+            requests.append((ascii_prompt, 30))
+            requests.append((braille_prompt, 50))
+            
+        # Pay the model load up front rather than inside the first completion
+        if warmup:
+            await self.warmup()
+        
+        responses = await self.complete_all(requests)
+        
+        # Decode all braille responses back to ASCII for comparison in one pass
+        ascii_predictions = responses[0::2]
+        braille_predictions = self.encoder.decode_batch(responses[1::2])
+        
+        # Score both arms into arrays; the statistics below work on these directly
+        expecteds = [test.expected for test in tests]
+        ascii_similarities = calculate_similarity_batch(ascii_predictions, expecteds)
+        braille_similarities = calculate_similarity_batch(braille_predictions, expecteds)
+        stripped = [e.strip() for e in expecteds]
+        ascii_exacts = np.fromiter((p.strip() == e for p, e in zip(ascii_predictions, stripped)),
+                                   dtype=bool, count=len(tests))
+        braille_exacts = np.fromiter((p.strip() == e for p, e in zip(braille_predictions, stripped)),
+                                     dtype=bool, count=len(tests))
+        
+        for i, test in enumerate(tests):
+            print(f"\nTest {i+1}/{len(tests)}")
             
-            ascii_similarities.append(test.ascii_similarity)
-            braille_similarities.append(test.braille_similarity)
+            test.ascii_prediction = ascii_predictions[i]
+            test.ascii_similarity = float(ascii_similarities[i])
+            test.ascii_exact = bool(ascii_exacts[i])
+            
+            test.braille_prediction = braille_predictions[i]
+            test.braille_similarity = float(braille_similarities[i])
+            test.braille_exact = bool(braille_exacts[i])
             
             print(f"  Expected: {test.expected[:50]}...")
             print(f"  ASCII sim: {test.ascii_similarity:.2f}, Braille sim: {test.braille_similarity:.2f}")
@@ -201,11 +489,11 @@ Next line (in braille):"""
         print("RESULTS")
         print("="*70)
         
-        avg_ascii = statistics.mean(ascii_similarities)
-        avg_braille = statistics.mean(braille_similarities)
+        avg_ascii = float(ascii_similarities.mean())
+        avg_braille = float(braille_similarities.mean())
         
-        ascii_exact_count = sum(1 for t in tests if t.ascii_exact)
-        braille_exact_count = sum(1 for t in tests if t.braille_exact)
+        ascii_exact_count = int(ascii_exacts.sum())
+        braille_exact_count = int(braille_exacts.sum())
         
         print(f"\n  Samples: {len(tests)}")
         print(f"\n  Average Similarity Score:")
@@ -274,5 +562,18 @@ Next line (in braille):"""
 
 
 if __name__ == "__main__":
-    experiment = LLMCompletionExperiment(model="sal:latest")
-    results = experiment.run_experiment(num_tests=10)
+    parser = argparse.ArgumentParser(description="LLM code completion experiment")
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Always query Ollama instead of reusing cached completions')
+    parser.add_argument('--refresh-corpus', action='store_true',
+                        help='Re-scan the code tree instead of reusing cached snippets')
+    parser.add_argument('--warmup', action='store_true',
+                        help='Load the model into Ollama before the completions')
+    args = parser.parse_args()
+    
+    experiment = LLMCompletionExperiment(model="sal:latest", use_cache=not args.no_cache)
+    try:
+        results = asyncio.run(experiment._run_and_aclose(experiment.run_experiment_async(
+            num_tests=10, refresh_corpus=args.refresh_corpus, warmup=args.warmup)))
+    finally:
+        experiment.close()
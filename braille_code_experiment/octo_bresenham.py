@@ -13,7 +13,97 @@ Author: Ryan Barrett
 """
 
 import math
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Union
+
+import numpy as np
+
+# Optional JIT for the render loop; the NumPy path is the fallback
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+# Dot bit for (x, y), indexed by (x << 2) | y
+# x=0 is left column, x=1 is right column
+# y=0 is top row, y=3 is bottom row
+_DOT_BITS = (
+    0x01, 0x02, 0x04, 0x40,  # x=0: Dots 1, 2, 3, 7
+    0x08, 0x10, 0x20, 0x80,  # x=1: Dots 4, 5, 6, 8
+)
+
+# Dot bit per row (y=0..3) for each column
+_COLUMN_DOTS = (_DOT_BITS[:4], _DOT_BITS[4:])
+
+
+def _column_range_masks(dots: Tuple[int, ...]) -> Tuple[int, ...]:
+    """OR of the dots in rows lo..hi, indexed by lo * 4 + hi (0 if lo > hi)."""
+    return tuple(
+        sum(dots[lo:hi + 1]) for lo in range(4) for hi in range(4)
+    )
+
+
+# Solid vertical connector for every inclusive row range, per column
+_RANGE_MASKS = tuple(_column_range_masks(dots) for dots in _COLUMN_DOTS)
+
+# The same tables as arrays, for gathering masks over a whole stream
+_COLUMN_DOTS_NP = np.array(_COLUMN_DOTS, dtype=np.uint8)
+_RANGE_MASKS_NP = np.array(_RANGE_MASKS, dtype=np.uint8)
+
+
+def _masks_to_text(masks: np.ndarray) -> str:
+    """Braille text for an array of dot masks, decoded in one call."""
+    return (masks.astype('<u4') + 0x2800).tobytes().decode('utf-32-le')
+
+
+if HAS_NUMBA:
+    # Same decisions as the NumPy path, on unquantized float64 values.
+    # No fastmath: the bridge thresholds and rounding must match exactly
+    @njit(cache=True)
+    def _range_mask_jit(col, y_start, y_end):
+        low = np.rint(y_start)
+        high = np.rint(y_end)
+        if low > high:
+            low, high = high, low
+        if low < 0.0:
+            low = 0.0
+        if high > 3.0:
+            high = 3.0
+        if low > high:
+            return np.int64(0)
+        return np.int64(_RANGE_MASKS_NP[col, int(low) * 4 + int(high)])
+
+    @njit(cache=True)
+    def _single_dot_jit(col, y):
+        return np.int64(_COLUMN_DOTS_NP[col, int(min(max(np.rint(y), 0.0), 3.0))])
+
+    @njit(cache=True)
+    def _render_masks_jit(values, connect_chars):
+        n_pairs = values.shape[0] // 2
+        masks = np.empty(n_pairs, dtype=np.uint8)
+        standard = np.empty(n_pairs, dtype=np.uint8)
+        prev_right = 0.0
+        for k in range(n_pairs):
+            left = values[2 * k]
+            right = values[2 * k + 1]
+            mask = _single_dot_jit(0, left) | _single_dot_jit(1, right)
+            standard[k] = mask
+            
+            if connect_chars and k > 0 and abs(prev_right - left) > 1.0:
+                mask |= _range_mask_jit(0, left, (prev_right + left) / 2)
+            
+            delta = abs(left - right)
+            if delta > 1.0:
+                mid = (left + right) / 2
+                mask |= _range_mask_jit(0, left, mid) | _range_mask_jit(1, mid, right)
+            elif delta > 0.5:
+                mask |= _range_mask_jit(0, left, left + (right - left) * 0.3)
+                mask |= _range_mask_jit(1, right - (right - left) * 0.3, right)
+            
+            masks[k] = mask
+            prev_right = right
+        return masks, standard
 
 
 class OctoBresenham:
@@ -41,118 +131,110 @@ class OctoBresenham:
         # Base Unicode offset for Braille patterns
         self.base = 0x2800
         
-        # Map (x, y) coordinates to dot bit values
-        # x=0 is left column, x=1 is right column
-        # y=0 is top row, y=3 is bottom row
-        self.dot_map = {
-            (0, 0): 0x01,  # Dot 1
-            (1, 0): 0x08,  # Dot 4
-            (0, 1): 0x02,  # Dot 2
-            (1, 1): 0x10,  # Dot 5
-            (0, 2): 0x04,  # Dot 3
-            (1, 2): 0x20,  # Dot 6
-            (0, 3): 0x40,  # Dot 7
-            (1, 3): 0x80,  # Dot 8
-        }
-        
         # Precompute full column masks for efficiency
         self.left_col_full = 0x01 | 0x02 | 0x04 | 0x40   # ⡇
         self.right_col_full = 0x08 | 0x10 | 0x20 | 0x80  # ⢸
 
-    def _get_dots_for_range(self, col: int, y_start: float, y_end: float) -> int:
+    def _dots_for_ranges(self, col: int, y_start: np.ndarray,
+                         y_end: np.ndarray) -> np.ndarray:
         """
-        Activates all dots in a column between y_start and y_end
-        to create a solid vertical connector.
-        
-        Args:
-            col: Column index (0=left, 1=right)
-            y_start: Starting y coordinate (0.0-3.0)
-            y_end: Ending y coordinate (0.0-3.0)
-            
-        Returns:
-            Bitmask of activated dots
+        Solid vertical connector masks for a column: all dots between each
+        y_start and y_end (0.0-3.0, either order), clamped to the cell.
         """
-        mask = 0
-        
-        # Determine range bounds
-        low = min(int(round(y_start)), int(round(y_end)))
-        high = max(int(round(y_start)), int(round(y_end)))
+        # np.rint rounds halves to even, exactly like round()
+        a = np.rint(y_start)
+        b = np.rint(y_end)
+        low = np.maximum(np.minimum(a, b), 0)
+        high = np.minimum(np.maximum(a, b), 3)
         
-        # Clamp to valid range [0, 3]
-        low = max(0, low)
-        high = min(3, high)
-
-        # Activate all dots in the range
-        for y in range(low, high + 1):
-            mask |= self.dot_map.get((col, y), 0)
-            
-        return mask
+        # Clamped bounds index the table; empty ranges contribute nothing
+        idx = (np.minimum(low, 3) * 4 + np.maximum(high, 0)).astype(np.intp)
+        return np.where(low > high, 0, _RANGE_MASKS_NP[col][idx]).astype(np.uint8)
 
-    def _get_single_dot(self, col: int, y: float) -> int:
-        """Get the dot mask for a single point."""
-        y_rounded = max(0, min(3, int(round(y))))
-        return self.dot_map.get((col, y_rounded), 0)
+    def _single_dots(self, col: int, y: np.ndarray) -> np.ndarray:
+        """Dot mask in a column for each point y (0.0-3.0), clamped to the cell."""
+        return _COLUMN_DOTS_NP[col][np.clip(np.rint(y), 0, 3).astype(np.intp)]
 
-    def render(self, data_stream: List[float], connect_chars: bool = True) -> str:
+    def render(self, data_stream: List[float], connect_chars: bool = True,
+               also_standard: bool = False) -> Union[str, Tuple[str, str]]:
         """
         Render a data stream as continuous Braille waveform.
         
         Args:
-            data_stream: List of floats normalized to range [0, 3]
+            data_stream: List (or array) of floats normalized to range [0, 3]
             connect_chars: If True, attempts to connect adjacent characters
+            also_standard: If True, also return the plain one-dot-per-column
+                           rendering from the same pass
             
         Returns:
-            String of Braille characters representing the waveform
+            String of Braille characters representing the waveform, or
+            (waveform, standard) if also_standard is set
         """
         if len(data_stream) < 2:
-            return ""
-            
-        result = []
-        prev_right_val = None
+            return ("", "") if also_standard else ""
         
-        # Process 2 data points at a time (left col, right col)
-        for i in range(0, len(data_stream) - 1, 2):
-            val_left = data_stream[i]
-            val_right = data_stream[i + 1]
-            
-            char_mask = 0
-            
-            # --- Inter-character connection ---
-            if connect_chars and prev_right_val is not None:
-                # Bridge from previous character's right to this character's left
-                if abs(prev_right_val - val_left) > 1.0:
-                    mid = (prev_right_val + val_left) / 2
-                    char_mask |= self._get_dots_for_range(0, val_left, mid)
-            
-            # --- Intra-character rendering ---
-            
-            # 1. Render base points for left and right columns
-            char_mask |= self._get_single_dot(0, val_left)
-            char_mask |= self._get_single_dot(1, val_right)
-            
-            # 2. The Bridge (Bresenham-lite interpolation)
-            # If there's a significant gap, fill intermediate dots
-            delta = abs(val_left - val_right)
-            
-            if delta > 1.0:
-                # Calculate midpoint for bridging
-                mid_val = (val_left + val_right) / 2
-                
-                # Fill left column towards midpoint
-                char_mask |= self._get_dots_for_range(0, val_left, mid_val)
-                
-                # Fill right column from midpoint
-                char_mask |= self._get_dots_for_range(1, mid_val, val_right)
-                
-            elif delta > 0.5:
-                # Smaller gap: just extend each column slightly toward the other
-                char_mask |= self._get_dots_for_range(0, val_left, val_left + (val_right - val_left) * 0.3)
-                char_mask |= self._get_dots_for_range(1, val_right - (val_right - val_left) * 0.3, val_right)
+        values = np.asarray(data_stream, dtype=np.float64)
+        if HAS_NUMBA:
+            char_mask, standard = _render_masks_jit(values, connect_chars)
+        else:
+            char_mask, standard = self._render_masks(values, connect_chars)
+        if also_standard:
+            return _masks_to_text(char_mask), _masks_to_text(standard)
+        return _masks_to_text(char_mask)
 
-            result.append(chr(self.base + char_mask))
-            prev_right_val = val_right
-            
-        return "".join(result)
+    def _render_masks(self, values: np.ndarray,
+                      connect_chars: bool) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Dot masks of every character of render(), with array operations.
+        
+        Every character depends only on its own pair of points and the
+        previous pair's right point, so all characters are computed at once.
+        Returns (full masks, standard single-dot masks).
+        """
+        # Process 2 data points at a time (left col, right col)
+        n_pairs = len(values) // 2
+        val_left = values[0:2 * n_pairs:2]
+        val_right = values[1:2 * n_pairs:2]
+        
+        # --- Intra-character rendering ---
+        
+        # 1. Render base points for left and right columns
+        standard = self._single_dots(0, val_left) | self._single_dots(1, val_right)
+        char_mask = standard.copy()
+        
+        # 2. The Bridge (Bresenham-lite interpolation)
+        # If there's a significant gap, fill intermediate dots
+        delta = np.abs(val_left - val_right)
+        
+        big = delta > 1.0
+        if big.any():
+            left, right = val_left[big], val_right[big]
+            # Calculate midpoint for bridging
+            mid_val = (left + right) / 2
+            # Fill left column towards midpoint, right column from midpoint
+            char_mask[big] |= (self._dots_for_ranges(0, left, mid_val) |
+                               self._dots_for_ranges(1, mid_val, right))
+        
+        small = (delta > 0.5) & ~big
+        if small.any():
+            # Smaller gap: just extend each column slightly toward the other
+            left, right = val_left[small], val_right[small]
+            char_mask[small] |= (
+                self._dots_for_ranges(0, left, left + (right - left) * 0.3) |
+                self._dots_for_ranges(1, right - (right - left) * 0.3, right)
+            )
+        
+        # --- Inter-character connection ---
+        if connect_chars and n_pairs > 1:
+            # Bridge from previous character's right to this character's left
+            prev_right = val_right[:-1]
+            left = val_left[1:]
+            gap = np.abs(prev_right - left) > 1.0
+            if gap.any():
+                mid = (prev_right[gap] + left[gap]) / 2
+                char_mask[1:][gap] |= self._dots_for_ranges(0, left[gap], mid)
+        
+        return char_mask, standard
 
     def render_multi_row(self, data_stream: List[float], 
                          height: int = 4, 
@@ -168,22 +250,21 @@ class OctoBresenham:
         Returns:
             Multi-line string with the graph
         """
-        if not data_stream:
+        if len(data_stream) == 0:
             return ""
+        
+        values = np.asarray(data_stream, dtype=np.float64)
             
         # Normalize data to full range
-        min_val = min(data_stream)
-        max_val = max(data_stream)
+        min_val = values.min()
+        max_val = values.max()
         range_val = max_val - min_val if max_val != min_val else 1
         
         # Each row has 4 sub-rows (y=0 to y=3)
         total_sub_rows = height * 4
         
         # Normalize to [0, total_sub_rows - 1]
-        normalized = [
-            ((v - min_val) / range_val) * (total_sub_rows - 1)
-            for v in data_stream
-        ]
+        normalized = ((values - min_val) / range_val) * (total_sub_rows - 1)
         
         # Build each row
         rows = []
@@ -191,29 +272,19 @@ class OctoBresenham:
             row_min = (height - 1 - row_idx) * 4
             row_max = row_min + 3
             
-            # Map data to this row's coordinate space
-            row_data = []
-            for val in normalized:
-                if val >= row_min and val <= row_max:
-                    # Value is in this row
-                    row_data.append(val - row_min)
-                elif val > row_max:
-                    # Value is above this row - show at top
-                    row_data.append(0.0)
-                else:
-                    # Value is below this row - show at bottom
-                    row_data.append(3.0)
+            above = normalized > row_max
+            below = normalized < row_min
+            in_row = ~(above | below)
             
             # Check if this row has any actual data
-            has_data = any(
-                row_min <= normalized[i] <= row_max 
-                for i in range(len(normalized))
-            )
+            if not in_row.any():
+                rows.append(" " * (len(normalized) // 2))
+                continue
             
-            if has_data:
-                rows.append(self.render(row_data))
-            else:
-                rows.append(" " * (len(row_data) // 2))
+            # Map data to this row's coordinate space: values above this
+            # row show at the top, values below it at the bottom
+            row_data = np.where(above, 0.0, np.where(below, 3.0, normalized - row_min))
+            rows.append(self.render(row_data))
                 
         return "\n".join(rows)
 
@@ -242,6 +313,11 @@ class OctoHeatmap:
             0x40 | 0x80 | 0x04 | 0x20 | 0x02 | 0x10 | 0x01,  # 7 dots: ⣷
             0xFF,                          # 8 dots: ⣿ (full block)
         ]
+        
+        # Code points per level, gathered for a whole heatmap at once
+        self._pattern_codes = np.array(
+            [self.base + p for p in self.intensity_patterns], dtype='<u4'
+        )
     
     def render_heatmap(self, data_2d: List[List[float]], 
                        normalize: bool = True) -> str:
@@ -257,38 +333,38 @@ class OctoHeatmap:
         """
         if not data_2d:
             return ""
+        
+        # All cells in one flat array (rows may differ in length)
+        lengths = [len(row) for row in data_2d]
+        if len(set(lengths)) == 1:
+            flat = np.array(data_2d, dtype=np.float64).ravel()
+        else:
+            flat = np.concatenate([np.asarray(row, dtype=np.float64) for row in data_2d])
             
         if normalize:
-            # Find global min/max
-            flat = [v for row in data_2d for v in row]
-            min_val = min(flat)
-            max_val = max(flat)
+            # Find global min/max, then normalize in place
+            min_val = flat.min()
+            max_val = flat.max()
             range_val = max_val - min_val if max_val != min_val else 1
-            
-            data_2d = [
-                [(v - min_val) / range_val for v in row]
-                for row in data_2d
-            ]
+            flat -= min_val
+            flat /= range_val
+        
+        # Map [0, 1] to [0, 8] intensity levels (np.rint rounds like round())
+        levels = np.clip(np.rint(flat * 8), 0, 8).astype(np.intp)
+        text = self._pattern_codes[levels].tobytes().decode('utf-32-le')
         
         rows = []
-        for row in data_2d:
-            chars = []
-            for val in row:
-                # Map [0, 1] to [0, 8] intensity levels
-                level = int(round(val * 8))
-                level = max(0, min(8, level))
-                chars.append(chr(self.base + self.intensity_patterns[level]))
-            rows.append("".join(chars))
+        start = 0
+        for n in lengths:
+            rows.append(text[start:start + n])
+            start += n
             
         return "\n".join(rows)
     
     def render_gradient(self, width: int = 40) -> str:
         """Render a horizontal gradient to demonstrate intensity levels."""
-        row = []
-        for i in range(width):
-            level = int((i / (width - 1)) * 8)
-            row.append(chr(self.base + self.intensity_patterns[level]))
-        return "".join(row)
+        levels = (np.arange(width) / (width - 1) * 8).astype(np.intp)
+        return self._pattern_codes[levels].tobytes().decode('utf-32-le')
 
 
 class OctoSparkline:
@@ -310,26 +386,23 @@ class OctoSparkline:
         Returns:
             Single-line sparkline string
         """
-        if not data:
+        if len(data) == 0:
             return ""
+        
+        values = np.asarray(data, dtype=np.float64)
             
-        # Resample if width specified
-        if width and len(data) != width * 2:
-            resampled = []
-            for i in range(width * 2):
-                idx = int((i / (width * 2)) * len(data))
-                resampled.append(data[min(idx, len(data) - 1)])
-            data = resampled
+        # Resample if width specified (same float index arithmetic as
+        # int((i / (width * 2)) * len(data)), so the picked points match)
+        if width and len(values) != width * 2:
+            idx = (np.arange(width * 2) / (width * 2) * len(values)).astype(np.intp)
+            values = values[np.minimum(idx, len(values) - 1)]
         
         # Normalize to [0, 3]
-        min_val = min(data)
-        max_val = max(data)
+        min_val = values.min()
+        max_val = values.max()
         range_val = max_val - min_val if max_val != min_val else 1
         
-        normalized = [
-            ((v - min_val) / range_val) * 3
-            for v in data
-        ]
+        normalized = ((values - min_val) / range_val) * 3
         
         return self.bresenham.render(normalized)
 
@@ -341,11 +414,8 @@ def demo_sine_wave():
     print("=" * 60)
     
     width = 60
-    data = []
-    for i in range(width * 2):
-        angle = (i / 15.0) * math.pi
-        val = (math.sin(angle) + 1) * 1.5
-        data.append(val)
+    angles = (np.arange(width * 2) / 15.0) * math.pi
+    data = (np.sin(angles) + 1) * 1.5
     
     renderer = OctoBresenham()
     output = renderer.render(data)
@@ -362,16 +432,13 @@ def demo_complex_wave():
     print("=" * 60)
     
     width = 80
-    data = []
-    for i in range(width * 2):
-        t = i / 20.0
-        # Fundamental + harmonics
-        val = math.sin(t * math.pi) * 0.6
-        val += math.sin(t * math.pi * 2) * 0.25
-        val += math.sin(t * math.pi * 3) * 0.15
-        # Normalize to [0, 3]
-        val = (val + 1) * 1.5
-        data.append(val)
+    t = np.arange(width * 2) / 20.0
+    # Fundamental + harmonics
+    val = np.sin(t * math.pi) * 0.6
+    val += np.sin(t * math.pi * 2) * 0.25
+    val += np.sin(t * math.pi * 3) * 0.15
+    # Normalize to [0, 3]
+    data = (val + 1) * 1.5
     
     renderer = OctoBresenham()
     output = renderer.render(data)
@@ -410,18 +477,12 @@ def demo_heatmap():
     # Create a simple 2D heatmap (Gaussian blob)
     print("\n2D Gaussian Heatmap:")
     size = 20
-    data_2d = []
-    for y in range(size):
-        row = []
-        for x in range(size):
-            # Distance from center
-            dx = (x - size/2) / (size/2)
-            dy = (y - size/2) / (size/2)
-            val = math.exp(-(dx*dx + dy*dy) * 2)
-            row.append(val)
-        data_2d.append(row)
+    # Distance from center
+    d = (np.arange(size) - size/2) / (size/2)
+    dy, dx = np.meshgrid(d, d, indexing='ij')
+    data_2d = np.exp(-(dx*dx + dy*dy) * 2)
     
-    print(heatmap.render_heatmap(data_2d))
+    print(heatmap.render_heatmap(data_2d.tolist()))
 
 
 def demo_sparkline():
@@ -435,18 +496,16 @@ def demo_sparkline():
     # Random walk
     import random
     random.seed(42)
-    data = [50]
-    for _ in range(199):
-        data.append(data[-1] + random.gauss(0, 3))
+    steps = [50] + [random.gauss(0, 3) for _ in range(199)]
+    data = np.cumsum(steps)
     
     print("\nRandom Walk (200 points → 50 chars):")
     print(sparkline.render(data, width=50))
     
     # Stock-like pattern
-    data = []
-    for i in range(100):
-        val = 50 + 20 * math.sin(i / 10) + 10 * math.sin(i / 3) + random.gauss(0, 2)
-        data.append(val)
+    i = np.arange(100)
+    noise = np.array([random.gauss(0, 2) for _ in range(100)])
+    data = 50 + 20 * np.sin(i / 10) + 10 * np.sin(i / 3) + noise
     
     print("\nStock-like Pattern:")
     print(sparkline.render(data, width=50))
@@ -462,63 +521,40 @@ def demo_comparison():
     
     # Use sharp transitions to show the difference clearly
     print("\n1. Sharp Square Wave (where interpolation shines):")
-    data = []
-    for i in range(60):
-        # Square wave with sharp transitions
-        if (i // 6) % 2 == 0:
-            data.append(0.0)
-        else:
-            data.append(3.0)
+    # Square wave with sharp transitions
+    data = np.where((np.arange(60) // 6) % 2 == 0, 0.0, 3.0)
+    octo, standard = renderer.render(data, also_standard=True)
     
     # Standard: just individual dots
     print("\n   Standard (gaps at transitions):")
-    standard_result = []
-    for i in range(0, len(data) - 1, 2):
-        mask = renderer._get_single_dot(0, data[i])
-        mask |= renderer._get_single_dot(1, data[i + 1])
-        standard_result.append(chr(0x2800 + mask))
-    print("   " + "".join(standard_result))
+    print("   " + standard)
     
     # Octo-Bresenham: connected
     print("\n   Octo-Bresenham (filled transitions):")
-    print("   " + renderer.render(data))
+    print("   " + octo)
     
     # Sawtooth wave
     print("\n2. Sawtooth Wave:")
-    data = []
-    for i in range(80):
-        val = (i % 10) / 10.0 * 3.0
-        data.append(val)
+    data = (np.arange(80) % 10) / 10.0 * 3.0
+    octo, standard = renderer.render(data, also_standard=True)
     
     print("\n   Standard:")
-    standard_result = []
-    for i in range(0, len(data) - 1, 2):
-        mask = renderer._get_single_dot(0, data[i])
-        mask |= renderer._get_single_dot(1, data[i + 1])
-        standard_result.append(chr(0x2800 + mask))
-    print("   " + "".join(standard_result))
+    print("   " + standard)
     
     print("\n   Octo-Bresenham:")
-    print("   " + renderer.render(data))
+    print("   " + octo)
     
     # Steep sine wave
     print("\n3. Fast Sine Wave (high frequency):")
-    data = []
-    for i in range(80):
-        angle = (i / 5.0) * math.pi
-        val = (math.sin(angle) + 1) * 1.5
-        data.append(val)
+    angles = (np.arange(80) / 5.0) * math.pi
+    data = (np.sin(angles) + 1) * 1.5
+    octo, standard = renderer.render(data, also_standard=True)
     
     print("\n   Standard:")
-    standard_result = []
-    for i in range(0, len(data) - 1, 2):
-        mask = renderer._get_single_dot(0, data[i])
-        mask |= renderer._get_single_dot(1, data[i + 1])
-        standard_result.append(chr(0x2800 + mask))
-    print("   " + "".join(standard_result))
+    print("   " + standard)
     
     print("\n   Octo-Bresenham:")
-    print("   " + renderer.render(data))
+    print("   " + octo)
 
 
 if __name__ == "__main__":
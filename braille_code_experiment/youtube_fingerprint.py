@@ -19,12 +19,16 @@ Author: Ryan Barrett
 
 import argparse
 import os
+import shutil
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List, Tuple
 
+import numpy as np
+
 from audio_fingerprint import AudioFingerprintGenerator, AudioFingerprint
 
 
@@ -33,6 +37,9 @@ class YouTubeFingerprint:
     Downloads YouTube audio and generates Braille fingerprints.
     """
     
+    # yt-dlp executable, found once per process
+    _ytdlp_path: Optional[str] = None
+    
     def __init__(self, width: int = 60, height: int = 4, 
                  keep_audio: bool = False, output_dir: Optional[str] = None):
         """
@@ -48,20 +55,22 @@ class YouTubeFingerprint:
         self.output_dir = output_dir or tempfile.gettempdir()
         self.generator = AudioFingerprintGenerator(width=width, height=height)
         
+        # Full yt-dlp metadata per normalized URL
+        self._info_cache: dict = {}
+        
         # Check for yt-dlp
         self._check_ytdlp()
     
     def _check_ytdlp(self):
-        """Verify yt-dlp is installed."""
-        try:
-            result = subprocess.run(
-                ['yt-dlp', '--version'],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode != 0:
-                raise FileNotFoundError
-        except FileNotFoundError:
+        """
+        Verify yt-dlp is installed.
+        
+        Only looks it up on PATH (once per process) rather than running
+        it; a broken install surfaces as a failed download instead.
+        """
+        if YouTubeFingerprint._ytdlp_path is None:
+            YouTubeFingerprint._ytdlp_path = shutil.which('yt-dlp')
+        if YouTubeFingerprint._ytdlp_path is None:
             print("⚠️  yt-dlp not found. Install with: brew install yt-dlp")
             print("   Or: pip install yt-dlp")
             sys.exit(1)
@@ -74,7 +83,11 @@ class YouTubeFingerprint:
         return f"https://www.youtube.com/watch?v={url_or_id}"
     
     def _get_video_info(self, url: str) -> dict:
-        """Get video metadata without downloading."""
+        """Get video metadata without downloading (cached per URL)."""
+        url = self._normalize_url(url)
+        if url in self._info_cache:
+            return self._info_cache[url]
+        
         result = subprocess.run(
             ['yt-dlp', '--dump-json', '--no-download', url],
             capture_output=True,
@@ -84,7 +97,9 @@ class YouTubeFingerprint:
             raise RuntimeError(f"Failed to get video info: {result.stderr}")
         
         import json
-        return json.loads(result.stdout)
+        info = json.loads(result.stdout)
+        self._info_cache[url] = info
+        return info
     
     def download_audio(self, url: str, output_path: Optional[str] = None) -> str:
         """
@@ -97,6 +112,18 @@ class YouTubeFingerprint:
         Returns:
             Path to downloaded WAV file
         """
+        return self._download(url, output_path)[0]
+    
+    def _download(self, url: str, output_path: Optional[str] = None) -> Tuple[str, dict]:
+        """
+        Download audio as WAV in a single yt-dlp run.
+        
+        yt-dlp prints the title/duration before downloading and the final
+        file path after conversion, so no second metadata call is needed.
+        
+        Returns:
+            Tuple of (path to WAV file, {'id', 'title', 'duration'})
+        """
         url = self._normalize_url(url)
         
         if output_path is None:
@@ -115,6 +142,8 @@ class YouTubeFingerprint:
             '--no-playlist',           # Single video only
             '--quiet',                 # Less verbose
             '--progress',              # But show progress
+            '--print', 'before_dl:%(id)s\t%(duration)s\t%(title)s',
+            '--print', 'after_move:filepath',  # Final path after conversion
             url
         ]
         
@@ -123,24 +152,72 @@ class YouTubeFingerprint:
         if result.returncode != 0:
             raise RuntimeError(f"Download failed: {result.stderr}")
         
-        # Find the actual output file
-        if '%(id)s' in output_path:
-            # Get video ID from URL
-            info = self._get_video_info(url)
-            video_id = info.get('id', 'unknown')
-            actual_path = output_path.replace('%(id)s', video_id).replace('%(ext)s', 'wav')
-        else:
-            actual_path = output_path.replace('%(ext)s', 'wav')
+        lines = result.stdout.strip().splitlines()
+        if not lines:
+            raise RuntimeError("Download failed: yt-dlp reported no output file")
+        actual_path = lines[-1]
         
-        if not os.path.exists(actual_path):
-            # Search for the file
-            for f in os.listdir(self.output_dir):
-                if f.endswith('.wav') and 'yt_audio' in f:
-                    actual_path = os.path.join(self.output_dir, f)
-                    break
+        info = {}
+        if len(lines) > 1:
+            fields = lines[-2].split('\t', 2)
+            if len(fields) == 3:
+                video_id, duration, title = fields
+                info = {'id': video_id, 'title': title, 'duration': duration}
         
         print(f"✅ Downloaded: {actual_path}")
-        return actual_path
+        return actual_path, info
+    
+    def download_audio_np(self, url: str, sample_rate: int = 22050,
+                          max_duration: int = 60, start_time: int = 0) -> np.ndarray:
+        """
+        Decode YouTube audio straight into memory, without a WAV on disk.
+        
+        yt-dlp streams the best audio format to stdout and ffmpeg decodes
+        it to mono 16-bit PCM on its stdout, which is read into NumPy.
+        
+        Args:
+            url: YouTube URL or video ID
+            sample_rate: Output sample rate in Hz
+            max_duration: Seconds of audio to decode
+            start_time: Offset in seconds to start decoding from
+            
+        Returns:
+            Mono float32 samples normalized to -1.0..1.0
+        """
+        url = self._normalize_url(url)
+        
+        print(f"⏳ Streaming audio from: {url}")
+        
+        download = subprocess.Popen(
+            ['yt-dlp', '-f', 'bestaudio', '-o', '-',
+             '--no-playlist', '--quiet', '--no-progress', url],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        decode = subprocess.Popen(
+            ['ffmpeg', '-hide_banner', '-loglevel', 'error',
+             '-ss', str(start_time), '-i', 'pipe:0', '-t', str(max_duration),
+             '-f', 's16le', '-ac', '1', '-ar', str(sample_rate), 'pipe:1'],
+            stdin=download.stdout,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        # Only ffmpeg holds the pipe now, so yt-dlp gets SIGPIPE when
+        # ffmpeg stops reading after max_duration
+        download.stdout.close()
+        
+        raw, decode_err = decode.communicate()
+        if download.poll() is None:
+            download.kill()
+        download_err = download.communicate()[1]
+        
+        if decode.returncode != 0 or not raw:
+            message = (download_err or decode_err).decode('utf-8', 'replace').strip()
+            raise RuntimeError(f"Download failed: {message}")
+        
+        samples = np.frombuffer(raw, dtype='<i2').astype(np.float32)
+        samples /= 32768.0
+        return samples
     
     def fingerprint_url(self, url: str, 
                         show_spectrogram: bool = True) -> Tuple[AudioFingerprint, str]:
@@ -156,19 +233,16 @@ class YouTubeFingerprint:
         """
         url = self._normalize_url(url)
         
-        # Get video info for title
-        try:
-            info = self._get_video_info(url)
-            title = info.get('title', 'Unknown')[:50]
-            duration = info.get('duration', 0)
-            print(f"📺 Video: {title}")
-            print(f"⏱️  Duration: {duration}s")
-        except Exception as e:
-            print(f"⚠️  Could not get video info: {e}")
-            title = "Unknown"
-        
-        # Download audio
-        audio_path = self.download_audio(url)
+        # Download audio; the same yt-dlp run reports the video info
+        audio_path, info = self._download(url)
+        return self._fingerprint_download(audio_path, info, show_spectrogram)
+    
+    def _fingerprint_download(self, audio_path: str, info: dict,
+                              show_spectrogram: bool = True) -> Tuple[AudioFingerprint, str]:
+        """Fingerprint a downloaded WAV, removing it unless keep_audio."""
+        title = info.get('title', 'Unknown')[:50]
+        print(f"📺 Video: {title}")
+        print(f"⏱️  Duration: {info.get('duration', 0)}s")
         
         try:
             # Generate fingerprint
@@ -184,8 +258,8 @@ class YouTubeFingerprint:
             
         finally:
             # Cleanup if not keeping audio
-            if not self.keep_audio and os.path.exists(audio_path):
-                os.remove(audio_path)
+            if not self.keep_audio:
+                Path(audio_path).unlink(missing_ok=True)
                 print("🗑️  Cleaned up temporary audio file")
     
     def compare_videos(self, urls: List[str]) -> str:
@@ -200,9 +274,24 @@ class YouTubeFingerprint:
         """
         fingerprints = []
         
-        for url in urls:
+        def download(url):
+            try:
+                return self._download(url)
+            except Exception as e:
+                print(f"⚠️  Failed to process {url}: {e}")
+                return None
+        
+        # Downloads are independent and wait on the network, so run them
+        # concurrently; map() keeps the results in URL order
+        with ThreadPoolExecutor(max_workers=max(1, min(4, len(urls)))) as executor:
+            downloads = list(executor.map(download, urls))
+        
+        # Fingerprint on this thread, one video at a time
+        for url, downloaded in zip(urls, downloads):
+            if downloaded is None:
+                continue
             try:
-                fp, _ = self.fingerprint_url(url, show_spectrogram=False)
+                fp, _ = self._fingerprint_download(*downloaded, show_spectrogram=False)
                 fingerprints.append(fp)
             except Exception as e:
                 print(f"⚠️  Failed to process {url}: {e}")
@@ -283,8 +372,8 @@ class YouTubeFingerprint:
             formatted = self.generator.format_fingerprint(fp)
             return fp, formatted
         finally:
-            if not self.keep_audio and os.path.exists(output_path):
-                os.remove(output_path)
+            if not self.keep_audio:
+                Path(output_path).unlink(missing_ok=True)
 
 
 def main():
@@ -18,12 +18,21 @@ Architecture:
     [Display] ← [Braille Output] ← [Syntax Highlighting] ← [Code Completion]
 """
 
-from .core import BrailleIDE, BrailleProject, BrailleFile
-from .editor import BrailleCodeEditor
-from .interface import BrailleInterface
-from .syntax import BrailleSyntaxHighlighter
-from .completion import BrailleCodeCompletion
-from .output import BrailleOutputRenderer
+import importlib
+
+# Public names and the submodule defining each; submodules are imported on
+# first attribute access (PEP 562) so importing one component doesn't load
+# every other one
+_LAZY = {
+    "BrailleIDE": ".core",
+    "BrailleProject": ".core",
+    "BrailleFile": ".core",
+    "BrailleCodeEditor": ".editor",
+    "BrailleInterface": ".interface",
+    "BrailleSyntaxHighlighter": ".syntax",
+    "BrailleCodeCompletion": ".completion",
+    "BrailleOutputRenderer": ".output",
+}
 
 __version__ = "1.0.0"
 __all__ = [
@@ -36,3 +45,15 @@ __all__ = [
     "BrailleCodeCompletion",
     "BrailleOutputRenderer",
 ]
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -11,54 +11,223 @@ Makes SAL IDE the most accessible coding environment:
 ⠁⠉⠉⠑⠎⠎⠊⠃⠊⠇⠊⠞⠽_⠋⠊⠗⠎⠞
 """
 
+import gzip
 import json
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Callable
-from enum import Enum
+import threading
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Final, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+from enum import IntEnum
+from types import MappingProxyType
 import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import numpy as np
+
+# braille8_core lives at the repository root; only add the root when it
+# isn't importable already, and append so it can't shadow other modules
+_ROOT = str(Path(__file__).resolve().parent.parent)
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)
 from braille8_core import Braille8Encoder
 
 
-class AccessibilityMode(str, Enum):
+# Announcements kept for history; older ones are dropped
+MAX_ANNOUNCEMENTS = 256
+
+# Quiet period before coalesced code-change announcements are flushed;
+# screen readers drop live-region updates that arrive faster than this
+CODE_CHANGE_DEBOUNCE_S = 0.05
+
+# Window in which polite announcements to the same live region are merged
+# (last one wins); updates closer together are lost by screen readers
+ANNOUNCE_COALESCE_S = 0.03
+
+# Live regions with their own announcer, so updates don't clobber each other
+ANNOUNCE_REGIONS = ("editor", "sal", "output")
+
+# Shared encoder; encoding is a single str.translate over a fixed table
+_ENCODER = Braille8Encoder()
+
+# Recently encoded texts: reopened files and repeated announcements reuse
+# their braille instead of re-translating (str hashes are cached, so a
+# hit costs one compare)
+_encode_braille = lru_cache(maxsize=256)(_ENCODER.encode)
+
+# Active dot numbers (1-8) for every 8-dot cell value (codepoint - U+2800)
+_DOTS_FOR_CODEPOINT = tuple(
+    tuple(i + 1 for i in range(8) if value & (1 << i)) for value in range(256)
+)
+
+
+# ARIA attributes per element type (read-only, shared by all callers)
+_ARIA_CONFIGS: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    "editor": MappingProxyType({
+        "role": "textbox",
+        "aria-multiline": "true",
+        "aria-label": "Code editor. Press Control slash to hear current line.",
+        "aria-live": "off",
+        "aria-describedby": "editor-help",
+    }),
+    "file_browser": MappingProxyType({
+        "role": "tree",
+        "aria-label": "File browser. Use arrow keys to navigate.",
+    }),
+    "file_item": MappingProxyType({
+        "role": "treeitem",
+        "aria-selected": "false",
+    }),
+    "sal_panel": MappingProxyType({
+        "role": "log",
+        "aria-label": "SAL Cascade autonomous coding panel",
+        "aria-live": "polite",
+    }),
+    "sal_input": MappingProxyType({
+        "role": "textbox",
+        "aria-label": "Describe what you want SAL to build",
+    }),
+    "output": MappingProxyType({
+        "role": "log",
+        "aria-label": "Code output and messages",
+        "aria-live": "polite",
+    }),
+    "braille_display": MappingProxyType({
+        "role": "region",
+        "aria-label": "Braille representation of code",
+        "aria-live": "polite",
+    }),
+    "token_counter": MappingProxyType({
+        "role": "status",
+        "aria-label": "SAL token counter",
+        "aria-live": "polite",
+    }),
+})
+
+# Shared empty result for element types without ARIA attributes
+_EMPTY_ATTRS: Mapping[str, str] = MappingProxyType({})
+
+# SAL status announcements; token messages take the token count via %d
+_STATIC_STATUS_MESSAGES: Mapping[str, str] = MappingProxyType({
+    "understanding": "SAL is understanding your intent",
+    "error": "SAL encountered an error",
+})
+_TOKEN_STATUS_MESSAGES: Mapping[str, str] = MappingProxyType({
+    "planning": "SAL is planning, %d tokens processed",
+    "coding": "SAL is writing code, %d tokens",
+    "completed": "SAL completed task with %d tokens",
+})
+
+
+class AccessibilityMode(IntEnum):
     """Accessibility modes for different needs"""
-    STANDARD = "standard"
-    SCREEN_READER = "screen_reader"
-    HIGH_CONTRAST = "high_contrast"
-    LARGE_TEXT = "large_text"
-    REDUCED_MOTION = "reduced_motion"
-    VOICE_ONLY = "voice_only"
-    BRAILLE_DISPLAY = "braille_display"
+    STANDARD = 0
+    SCREEN_READER = 1
+    HIGH_CONTRAST = 2
+    LARGE_TEXT = 3
+    REDUCED_MOTION = 4
+    VOICE_ONLY = 5
+    BRAILLE_DISPLAY = 6
 
 
-@dataclass
+# Spoken/serialized name of each mode
+_MODE_LABELS: Mapping[AccessibilityMode, str] = MappingProxyType({
+    AccessibilityMode.STANDARD: "standard",
+    AccessibilityMode.SCREEN_READER: "screen_reader",
+    AccessibilityMode.HIGH_CONTRAST: "high_contrast",
+    AccessibilityMode.LARGE_TEXT: "large_text",
+    AccessibilityMode.REDUCED_MOTION: "reduced_motion",
+    AccessibilityMode.VOICE_ONLY: "voice_only",
+    AccessibilityMode.BRAILLE_DISPLAY: "braille_display",
+})
+
+
+@dataclass(slots=True)
 class HapticPattern:
     """Haptic feedback pattern for braille displays"""
-    dots: List[int]  # Which dots to activate (1-8)
+    dots: Sequence[int]  # Which dots to activate (1-8)
     duration_ms: int = 100
     intensity: float = 1.0  # 0.0 to 1.0
     
     def to_vibration_pattern(self) -> List[int]:
         """Convert to Android/iOS vibration pattern [wait, vibrate, wait, ...]"""
-        pattern = []
-        for dot in self.dots:
-            pattern.extend([0, int(self.duration_ms * self.intensity)])
-        return pattern
+        on = int(self.duration_ms * self.intensity)
+        return [0, on] * len(self.dots)
 
 
-@dataclass
+@dataclass(slots=True)
 class AccessibilityAnnouncement:
     """Announcement for screen readers"""
     text: str
-    braille: str = ""
+    braille: str = ""  # Encoded from text on first read when left empty
     priority: str = "polite"  # polite, assertive
+    region: str = "editor"  # one of ANNOUNCE_REGIONS
+
+
+class _LazyBraille:
+    """
+    Wraps the braille slot so an empty value is encoded from the text on
+    first read; announcements that are only spoken never pay for it.
+    """
+    __slots__ = ("slot",)
+    
+    def __init__(self, slot):
+        self.slot = slot
+    
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self.slot
+        braille = self.slot.__get__(obj, owner)
+        if not braille:
+            braille = _encode_braille(obj.text)
+            self.slot.__set__(obj, braille)
+        return braille
+    
+    def __set__(self, obj, value: str):
+        self.slot.__set__(obj, value)
+
+
+AccessibilityAnnouncement.braille = _LazyBraille(AccessibilityAnnouncement.braille)
+
+
+# Keyboard help sections, in display order; Shortcut.category indexes this
+SHORTCUT_CATEGORIES = ("Navigation", "Actions", "Accessibility", "Voice")
+_NAVIGATION, _ACTIONS, _ACCESSIBILITY, _VOICE = range(len(SHORTCUT_CATEGORIES))
+
+
+class Shortcut(NamedTuple):
+    """A keyboard shortcut and the help section it is listed under"""
+    combo: str
+    desc: str
+    action: str
+    category: int
+
+
+# Default shortcuts, grouped and ordered as in the keyboard help
+_DEFAULT_SHORTCUTS = (
+    # Navigation
+    Shortcut("Alt+1", "Focus editor", "editor", _NAVIGATION),
+    Shortcut("Alt+2", "Focus file browser", "fileBrowser", _NAVIGATION),
+    Shortcut("Alt+3", "Focus SAL panel", "salPanel", _NAVIGATION),
+    Shortcut("Alt+4", "Focus output", "output", _NAVIGATION),
+    Shortcut("F6", "Next panel", "nextPanel", _NAVIGATION),
+    Shortcut("Shift+F6", "Previous panel", "prevPanel", _NAVIGATION),
+    
+    # Actions
+    Shortcut("Ctrl+Enter", "Run code", "runCode", _ACTIONS),
+    Shortcut("Ctrl+S", "Save file", "saveFile", _ACTIONS),
+    Shortcut("Ctrl+Shift+S", "Save to disk", "saveToDisk", _ACTIONS),
+    Shortcut("Ctrl+B", "Toggle braille mode", "toggleBraille", _ACTIONS),
+    Shortcut("Ctrl+Shift+B", "Build with SAL", "buildWithSal", _ACTIONS),
+    
+    # Accessibility
+    Shortcut("Ctrl+/", "Announce current line", "announceLine", _ACCESSIBILITY),
+    Shortcut("Ctrl+Shift+/", "Announce file summary", "announceFile", _ACCESSIBILITY),
     
-    def __post_init__(self):
-        if not self.braille:
-            encoder = Braille8Encoder()
-            self.braille = encoder.encode(self.text)
+    # Voice
+    Shortcut("Ctrl+Shift+V", "Start voice input", "startVoice", _VOICE),
+    Shortcut("Escape", "Stop voice input", "stopVoice", _VOICE),
+)
 
 
 class AccessibilityManager:
@@ -69,171 +238,216 @@ class AccessibilityManager:
     """
     
     def __init__(self):
-        self.encoder = Braille8Encoder()
+        self.encoder = _ENCODER
         self.mode = AccessibilityMode.STANDARD
-        self.announcements: List[AccessibilityAnnouncement] = []
-        self.keyboard_shortcuts: Dict[str, Callable] = {}
+        self.announcements: deque = deque(maxlen=MAX_ANNOUNCEMENTS)
+        self.shortcuts: List[Shortcut] = []
+        self._shortcut_index: Dict[str, int] = {}  # combo -> position in shortcuts
         self.focus_order: List[str] = []
         self.current_focus_index = 0
         
+        # Latest pending code-change text per line, flushed after a quiet period
+        self._pending_line_changes: Dict[int, str] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+        
+        # Latest queued polite announcement per live region
+        self._pending_polite: Dict[str, AccessibilityAnnouncement] = {}
+        self._polite_timer: Optional[threading.Timer] = None
+        
+        # Rendered get_keyboard_help() text; cleared when shortcuts change
+        self._keyboard_help_cache: Optional[str] = None
+        
+        # Token-free SAL statuses always say the same thing; reuse one each
+        self._static_status_announcements: Dict[str, AccessibilityAnnouncement] = {
+            status: AccessibilityAnnouncement(text=text, priority="assertive", region="sal")
+            for status, text in _STATIC_STATUS_MESSAGES.items()
+        }
+        
         # Default keyboard shortcuts for accessibility
         self._setup_default_shortcuts()
         
     def _setup_default_shortcuts(self):
         """Setup default accessibility keyboard shortcuts"""
-        self.keyboard_shortcuts = {
-            # Navigation
-            "Alt+1": ("Focus editor", "editor"),
-            "Alt+2": ("Focus file browser", "fileBrowser"),
-            "Alt+3": ("Focus SAL panel", "salPanel"),
-            "Alt+4": ("Focus output", "output"),
-            
-            # Actions
-            "Ctrl+Enter": ("Run code", "runCode"),
-            "Ctrl+S": ("Save file", "saveFile"),
-            "Ctrl+Shift+S": ("Save to disk", "saveToDisk"),
-            "Ctrl+B": ("Toggle braille mode", "toggleBraille"),
-            "Ctrl+Shift+B": ("Build with SAL", "buildWithSal"),
-            
-            # Accessibility
-            "F6": ("Next panel", "nextPanel"),
-            "Shift+F6": ("Previous panel", "prevPanel"),
-            "Ctrl+/": ("Announce current line", "announceLine"),
-            "Ctrl+Shift+/": ("Announce file summary", "announceFile"),
+        self.shortcuts = list(_DEFAULT_SHORTCUTS)
+        self._shortcut_index = {sc.combo: i for i, sc in enumerate(self.shortcuts)}
+        self._keyboard_help_cache = None
+        
+    @property
+    def keyboard_shortcuts(self) -> Dict[str, Tuple[str, str]]:
+        """Shortcuts as {combo: (description, action)}"""
+        return {sc.combo: (sc.desc, sc.action) for sc in self.shortcuts}
+        
+    def register_shortcut(self, key: str, description: str, action: str,
+                          category: Optional[str] = None):
+        """
+        Add or replace a keyboard shortcut.
+        
+        A replaced shortcut keeps its help section unless category is
+        given; new ones default to "Actions".
+        """
+        index = self._shortcut_index.get(key)
+        if category is not None:
+            category_id = SHORTCUT_CATEGORIES.index(category)
+        elif index is not None:
+            category_id = self.shortcuts[index].category
+        else:
+            category_id = _ACTIONS
             
-            # Voice
-            "Ctrl+Shift+V": ("Start voice input", "startVoice"),
-            "Escape": ("Stop voice input", "stopVoice"),
-        }
+        shortcut = Shortcut(key, description, action, category_id)
+        if index is None:
+            self._shortcut_index[key] = len(self.shortcuts)
+            self.shortcuts.append(shortcut)
+        else:
+            self.shortcuts[index] = shortcut
+        self._keyboard_help_cache = None
         
     def set_mode(self, mode: AccessibilityMode):
-        """Set accessibility mode"""
+        """Set accessibility mode (announced only when it changes)"""
+        if mode == self.mode:
+            return
         self.mode = mode
-        self.announce(f"Accessibility mode: {mode.value}")
+        self.announce(f"Accessibility mode: {_MODE_LABELS[mode]}")
+        
+    def announce(self, text: str, priority: str = "polite",
+                 region: str = "editor") -> AccessibilityAnnouncement:
+        """
+        Create an announcement for screen readers.
         
-    def announce(self, text: str, priority: str = "polite") -> AccessibilityAnnouncement:
-        """Create an announcement for screen readers"""
+        Assertive announcements are delivered at once and drop any polite
+        one still queued for the same region. Polite announcements are
+        queued per region, the last one wins, and the queue is delivered
+        ANNOUNCE_COALESCE_S after its first entry (or on flush_pending()).
+        """
         announcement = AccessibilityAnnouncement(
             text=text,
-            priority=priority
+            priority=priority,
+            region=region
         )
-        self.announcements.append(announcement)
+        self._queue(announcement)
         return announcement
         
+    def _queue(self, announcement: AccessibilityAnnouncement):
+        """Deliver an assertive announcement or queue a polite one"""
+        with self._pending_lock:
+            if announcement.priority == "assertive":
+                self._pending_polite.pop(announcement.region, None)
+                self.announcements.append(announcement)
+                return
+                
+            self._pending_polite[announcement.region] = announcement
+            if self._polite_timer is None:
+                self._polite_timer = threading.Timer(ANNOUNCE_COALESCE_S, self._flush_polite)
+                self._polite_timer.daemon = True
+                self._polite_timer.start()
+                
+    def _flush_polite(self) -> List[AccessibilityAnnouncement]:
+        """Deliver the queued polite announcements"""
+        with self._pending_lock:
+            pending = list(self._pending_polite.values())
+            self._pending_polite.clear()
+            if self._polite_timer is not None:
+                self._polite_timer.cancel()
+                self._polite_timer = None
+            self.announcements.extend(pending)
+        return pending
+        
+    def recent_announcements(self) -> List[AccessibilityAnnouncement]:
+        """Snapshot of the most recent announcements, oldest first"""
+        return list(self.announcements)
+        
     def announce_code_change(self, line_number: int, content: str, change_type: str = "edit"):
-        """Announce code changes for screen readers"""
-        braille_content = self.encoder.encode(content[:50])
+        """
+        Announce code changes for screen readers.
         
-        if change_type == "insert":
-            text = f"Line {line_number} inserted: {content[:100]}"
-        elif change_type == "delete":
+        Edits are debounced: successive changes to the same line collapse
+        into one announcement, made once no edit has arrived for
+        CODE_CHANGE_DEBOUNCE_S seconds (or on flush_pending()).
+        """
+        if change_type == "delete":
             text = f"Line {line_number} deleted"
         else:
-            text = f"Line {line_number}: {content[:100]}"
+            snippet = content[:100]
+            if change_type == "insert":
+                text = f"Line {line_number} inserted: {snippet}"
+            else:
+                text = f"Line {line_number}: {snippet}"
             
-        return self.announce(text, "polite")
+        with self._pending_lock:
+            self._pending_line_changes[line_number] = text
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            self._flush_timer = threading.Timer(CODE_CHANGE_DEBOUNCE_S, self.flush_pending)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+            
+    def flush_pending(self) -> List[AccessibilityAnnouncement]:
+        """
+        Deliver everything queued now: pending code changes (one per line,
+        already debounced, so not merged further) and polite announcements.
+        """
+        with self._pending_lock:
+            pending = self._pending_line_changes
+            self._pending_line_changes = {}
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            
+            changes = [
+                AccessibilityAnnouncement(text=text, priority="polite", region="editor")
+                for text in pending.values()
+            ]
+            self.announcements.extend(changes)
+                
+        return changes + self._flush_polite()
         
     def announce_sal_status(self, status: str, tokens: int = 0):
         """Announce SAL Cascade status changes"""
-        status_messages = {
-            "understanding": "SAL is understanding your intent",
-            "planning": f"SAL is planning, {tokens} tokens processed",
-            "coding": f"SAL is writing code, {tokens} tokens",
-            "completed": f"SAL completed task with {tokens} tokens",
-            "error": "SAL encountered an error",
-        }
-        
-        text = status_messages.get(status, f"SAL status: {status}")
-        return self.announce(text, "assertive")
+        announcement = self._static_status_announcements.get(status)
+        if announcement is not None:
+            self._queue(announcement)
+            return announcement
+            
+        if status in _TOKEN_STATUS_MESSAGES:
+            text = _TOKEN_STATUS_MESSAGES[status] % tokens
+        else:
+            text = f"SAL status: {status}"
+        return self.announce(text, "assertive", region="sal")
         
-    def get_aria_attributes(self, element_type: str) -> Dict[str, str]:
+    def get_aria_attributes(self, element_type: str) -> Mapping[str, str]:
         """Get ARIA attributes for an element type"""
-        aria_configs = {
-            "editor": {
-                "role": "textbox",
-                "aria-multiline": "true",
-                "aria-label": "Code editor. Press Control slash to hear current line.",
-                "aria-live": "off",
-                "aria-describedby": "editor-help",
-            },
-            "file_browser": {
-                "role": "tree",
-                "aria-label": "File browser. Use arrow keys to navigate.",
-            },
-            "file_item": {
-                "role": "treeitem",
-                "aria-selected": "false",
-            },
-            "sal_panel": {
-                "role": "log",
-                "aria-label": "SAL Cascade autonomous coding panel",
-                "aria-live": "polite",
-            },
-            "sal_input": {
-                "role": "textbox",
-                "aria-label": "Describe what you want SAL to build",
-            },
-            "output": {
-                "role": "log",
-                "aria-label": "Code output and messages",
-                "aria-live": "polite",
-            },
-            "braille_display": {
-                "role": "region",
-                "aria-label": "Braille representation of code",
-                "aria-live": "polite",
-            },
-            "token_counter": {
-                "role": "status",
-                "aria-label": "SAL token counter",
-                "aria-live": "polite",
-            },
-        }
-        
-        return aria_configs.get(element_type, {})
+        return _ARIA_CONFIGS.get(element_type, _EMPTY_ATTRS)
         
     def generate_haptic_for_code(self, code: str) -> List[HapticPattern]:
         """Generate haptic patterns for code (for braille displays)"""
-        patterns = []
-        braille = self.encoder.encode(code)
-        
-        for char in braille:
-            # Convert braille unicode to dot pattern
-            if '\u2800' <= char <= '\u28FF':
-                dots_value = ord(char) - 0x2800
-                active_dots = []
-                for i in range(8):
-                    if dots_value & (1 << i):
-                        active_dots.append(i + 1)
-                        
-                patterns.append(HapticPattern(
-                    dots=active_dots,
-                    duration_ms=80,
-                    intensity=0.8
-                ))
-                
-        return patterns
+        braille = _encode_braille(code)
+        
+        # Convert braille unicode to dot values for the whole string at once
+        codepoints = np.frombuffer(braille.encode('utf-32-le'), dtype='<u4')
+        dots_values = codepoints[(codepoints >= 0x2800) & (codepoints <= 0x28FF)] - 0x2800
+        
+        return [
+            HapticPattern(dots=_DOTS_FOR_CODEPOINT[value], duration_ms=80, intensity=0.8)
+            for value in dots_values.tolist()
+        ]
         
     def get_keyboard_help(self) -> str:
         """Get keyboard shortcuts help text"""
+        if self._keyboard_help_cache is not None:
+            return self._keyboard_help_cache
+            
+        # One pass over the shortcuts, bucketed by help section
+        sections = [[f"{category}:"] for category in SHORTCUT_CATEGORIES]
+        for sc in self.shortcuts:
+            sections[sc.category].append(f"  {sc.combo}: {sc.desc}")
+            
         lines = ["SAL IDE Keyboard Shortcuts:", ""]
-        
-        categories = {
-            "Navigation": ["Alt+1", "Alt+2", "Alt+3", "Alt+4", "F6", "Shift+F6"],
-            "Actions": ["Ctrl+Enter", "Ctrl+S", "Ctrl+Shift+S", "Ctrl+B", "Ctrl+Shift+B"],
-            "Accessibility": ["Ctrl+/", "Ctrl+Shift+/"],
-            "Voice": ["Ctrl+Shift+V", "Escape"],
-        }
-        
-        for category, keys in categories.items():
-            lines.append(f"{category}:")
-            for key in keys:
-                if key in self.keyboard_shortcuts:
-                    desc, _ = self.keyboard_shortcuts[key]
-                    lines.append(f"  {key}: {desc}")
+        for section in sections:
+            lines.extend(section)
             lines.append("")
             
-        return "\n".join(lines)
+        self._keyboard_help_cache = "\n".join(lines)
+        return self._keyboard_help_cache
         
     def get_focus_order(self) -> List[Dict[str, str]]:
         """Get focus order for tab navigation"""
@@ -246,10 +460,8 @@ class AccessibilityManager:
         ]
 
 
-# Generate accessibility JavaScript for the web app
-def generate_accessibility_js() -> str:
-    """Generate JavaScript for accessibility features"""
-    return '''
+# Accessibility JavaScript for the web app (built once at import)
+_ACCESSIBILITY_JS: Final[str] = '''
     // ============================================
     // SAL IDE Accessibility Features
     // ============================================
@@ -258,17 +470,47 @@ def generate_accessibility_js() -> str:
         mode: 'standard',
         announcements: [],
         
-        // Announce to screen readers
-        announce: function(text, priority = 'polite') {
-            const announcer = document.getElementById('screenReaderAnnouncer');
+        // Live regions, each with its own announcer
+        regions: ['editor', 'sal', 'output'],
+        _pendingText: {},
+        _flushTimer: null,
+        
+        // Announce to screen readers. Assertive text interrupts; polite text
+        // is queued per region (last wins) and flushed after 30 ms, since
+        // screen readers drop updates that arrive closer together
+        announce: function(text, priority = 'polite', region = 'editor') {
+            if (priority === 'assertive') {
+                delete this._pendingText[region];
+                this._speak(text, priority, region);
+            } else {
+                this._pendingText[region] = text;
+                if (!this._flushTimer) {
+                    this._flushTimer = setTimeout(() => this._flush(), 30);
+                }
+            }
+            console.log('[A11y]', text);
+        },
+        
+        _flush: function() {
+            this._flushTimer = null;
+            const pending = this._pendingText;
+            this._pendingText = {};
+            for (const region in pending) {
+                this._speak(pending[region], 'polite', region);
+            }
+        },
+        
+        _speak: function(text, priority, region) {
+            const announcer = document.getElementById(`screenReaderAnnouncer-${region}`)
+                || document.getElementById('screenReaderAnnouncer');
             if (announcer) {
                 announcer.setAttribute('aria-live', priority);
                 announcer.textContent = text;
                 
                 // Clear after announcement
-                setTimeout(() => { announcer.textContent = ''; }, 1000);
+                clearTimeout(announcer._clearTimer);
+                announcer._clearTimer = setTimeout(() => { announcer.textContent = ''; }, 1000);
             }
-            console.log('[A11y]', text);
         },
         
         // Announce SAL status changes
@@ -280,7 +522,7 @@ def generate_accessibility_js() -> str:
                 'completed': `SAL completed. ${tokens} tokens used.`,
                 'error': 'SAL encountered an error'
             };
-            this.announce(messages[status] || `SAL: ${status}`, 'assertive');
+            this.announce(messages[status] || `SAL: ${status}`, 'assertive', 'sal');
         },
         
         // Announce current line for screen readers
@@ -327,37 +569,39 @@ def generate_accessibility_js() -> str:
             }
         },
         
+        // Keyboard shortcuts, keyed by combo ('Ctrl+Shift+Alt+key' order)
+        shortcuts: {
+            'Ctrl+/': (a) => a.announceCurrentLine(),
+            'F6': (a) => a.focusNext(),
+            'Shift+F6': (a) => a.focusPrev(),
+            'Alt+1': () => document.getElementById('codeInput')?.focus(),
+            'Alt+2': () => document.getElementById('fileTree')?.focus(),
+            'Alt+3': () => document.getElementById('cascadeInput')?.focus(),
+            'Alt+4': () => document.getElementById('outputContent')?.focus(),
+        },
+        
         // Keyboard shortcut handling
         handleKeyboard: function(e) {
-            const key = [];
-            if (e.ctrlKey) key.push('Ctrl');
-            if (e.shiftKey) key.push('Shift');
-            if (e.altKey) key.push('Alt');
-            key.push(e.key);
-            const combo = key.join('+');
+            // Plain typing never matches a shortcut
+            if (!e.ctrlKey && !e.altKey && e.key.length === 1) return;
             
-            // Accessibility shortcuts
-            if (combo === 'Ctrl+/') {
-                e.preventDefault();
-                this.announceCurrentLine();
-            }
-            if (e.key === 'F6') {
+            const combo = (e.ctrlKey ? 'Ctrl+' : '') + (e.shiftKey ? 'Shift+' : '') +
+                          (e.altKey ? 'Alt+' : '') + e.key;
+            const action = this.shortcuts[combo];
+            if (action) {
                 e.preventDefault();
-                if (e.shiftKey) this.focusPrev();
-                else this.focusNext();
+                action(this);
             }
-            if (combo === 'Alt+1') { e.preventDefault(); document.getElementById('codeInput')?.focus(); }
-            if (combo === 'Alt+2') { e.preventDefault(); document.getElementById('fileTree')?.focus(); }
-            if (combo === 'Alt+3') { e.preventDefault(); document.getElementById('cascadeInput')?.focus(); }
-            if (combo === 'Alt+4') { e.preventDefault(); document.getElementById('outputContent')?.focus(); }
         },
         
         // Initialize accessibility
         init: function() {
-            // Add screen reader announcer
-            if (!document.getElementById('screenReaderAnnouncer')) {
+            // Add one screen reader announcer per live region
+            for (const region of this.regions) {
+                const id = `screenReaderAnnouncer-${region}`;
+                if (document.getElementById(id)) continue;
                 const announcer = document.createElement('div');
-                announcer.id = 'screenReaderAnnouncer';
+                announcer.id = id;
                 announcer.setAttribute('role', 'status');
                 announcer.setAttribute('aria-live', 'polite');
                 announcer.setAttribute('aria-atomic', 'true');
@@ -386,9 +630,8 @@ def generate_accessibility_js() -> str:
 '''
 
 
-def generate_accessibility_css() -> str:
-    """Generate CSS for accessibility features"""
-    return '''
+# Accessibility CSS for the web app
+_ACCESSIBILITY_CSS: Final[str] = '''
     /* Screen reader only class */
     .sr-only {
         position: absolute;
@@ -468,5 +711,33 @@ def generate_accessibility_css() -> str:
 '''
 
 
-# Global accessibility manager instance
-a11y = AccessibilityManager()
+
+def generate_accessibility_js() -> str:
+    """Generate JavaScript for accessibility features"""
+    return _ACCESSIBILITY_JS
+
+
+def generate_accessibility_css() -> str:
+    """Generate CSS for accessibility features"""
+    return _ACCESSIBILITY_CSS
+
+
+@lru_cache(maxsize=None)
+def generate_accessibility_js_gz() -> bytes:
+    """Gzip-compressed accessibility JavaScript, for pre-compressed responses"""
+    return gzip.compress(_ACCESSIBILITY_JS.encode("utf-8"), mtime=0)
+
+
+@lru_cache(maxsize=None)
+def generate_accessibility_css_gz() -> bytes:
+    """Gzip-compressed accessibility CSS, for pre-compressed responses"""
+    return gzip.compress(_ACCESSIBILITY_CSS.encode("utf-8"), mtime=0)
+
+
+# Global accessibility manager instance, created on first access (PEP 562)
+def __getattr__(name):
+    if name == "a11y":
+        global a11y
+        a11y = AccessibilityManager()
+        return a11y
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -13,7 +13,11 @@ This allows SAL-generated code to be automatically graphed.
 """
 
 import ast
+import hashlib
+import os
+import pickle
 import re
+from collections import OrderedDict
 from typing import Dict, List, Optional, Set, Tuple, Any
 from dataclasses import dataclass, field
 from enum import Enum
@@ -23,6 +27,21 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from braille8_core import Braille8Encoder
 
+# Shared encoder; the translate tables are class-level, so one instance
+# serves every analyzer
+_ENCODER = Braille8Encoder()
+
+
+# Pickled CodeAnalysis results, one file per (source, analyzer) key
+ANALYSIS_CACHE_DIR = Path.home() / ".cache" / "sal-voice" / "ast"
+
+# Bump when analyzer output changes so stale cache entries are ignored
+_ANALYSIS_CACHE_VERSION = 2
+
+# In-process LRU of pickled results (bytes, so every hit is a fresh copy)
+_ANALYSIS_MEMO_SIZE = 128
+_analysis_memo: "OrderedDict[str, bytes]" = OrderedDict()
+
 
 class SymbolType(str, Enum):
     """Types of code symbols"""
@@ -35,6 +54,24 @@ class SymbolType(str, Enum):
     DECORATOR = "decorator"
 
 
+class _LazyBrailleName:
+    """
+    Field descriptor for CodeSymbol.braille_name: an empty value is
+    encoded from the name on first read, so symbols that are never
+    displayed never pay for it.
+    """
+    
+    def __get__(self, obj, owner=None) -> str:
+        if obj is None:
+            return ""  # The field's default
+        if not obj._braille_name:
+            obj._braille_name = _ENCODER.encode(obj.name)
+        return obj._braille_name
+    
+    def __set__(self, obj, value: str):
+        obj._braille_name = value
+
+
 @dataclass
 class CodeSymbol:
     """A symbol extracted from code"""
@@ -46,12 +83,7 @@ class CodeSymbol:
     docstring: str = ""
     parent: str = ""  # Parent class/function name
     decorators: List[str] = field(default_factory=list)
-    braille_name: str = ""
-    
-    def __post_init__(self):
-        if not self.braille_name:
-            encoder = Braille8Encoder()
-            self.braille_name = encoder.encode(self.name)
+    braille_name: str = _LazyBrailleName()  # Encoded from name on first read when left empty
 
 
 @dataclass
@@ -84,6 +116,13 @@ class CodeAnalysis:
     line_count: int = 0
     
     def to_dict(self) -> Dict:
+        # Encode the names not yet read in one batch rather than one per symbol
+        pending = [s for s in self.symbols if not s._braille_name]
+        if pending:
+            names = _ENCODER.encode_batch([s.name for s in pending])
+            for symbol, braille_name in zip(pending, names):
+                symbol.braille_name = braille_name
+                
         return {
             "language": self.language,
             "symbols": [
@@ -120,15 +159,38 @@ class CodeAnalysis:
         }
 
 
-class PythonAnalyzer(ast.NodeVisitor):
-    """Analyze Python code using AST"""
+# Nodes that can appear inside an expression and may contain calls
+_EXPR_PARTS = (ast.expr, ast.comprehension, ast.keyword, ast.arguments)
+
+# Common expression leaves with nothing to walk below them
+_CALL_FREE_LEAVES = frozenset((ast.Name, ast.Constant))
+
+
+class PythonAnalyzer:
+    """
+    Analyze Python code using AST.
+    
+    The tree is walked iteratively with an explicit stack. Each entry
+    carries the name of its enclosing class/function ("" at module level),
+    so no scope stack is kept. Handlers return the scope for the node's
+    children, or None when there is nothing below the node to collect.
+    """
     
     def __init__(self):
         self.symbols: List[CodeSymbol] = []
         self.imports: List[ImportInfo] = []
         self.calls: List[CallInfo] = []
-        self.current_scope: List[str] = []  # Stack of class/function names
-        self.encoder = Braille8Encoder()
+        self.encoder = _ENCODER
+        
+        # Handler per node type, looked up once per statement-level node
+        self._dispatch = {
+            ast.FunctionDef: self.visit_FunctionDef,
+            ast.AsyncFunctionDef: self.visit_FunctionDef,
+            ast.ClassDef: self.visit_ClassDef,
+            ast.Import: self.visit_Import,
+            ast.ImportFrom: self.visit_ImportFrom,
+            ast.Assign: self.visit_Assign,
+        }
         
     def analyze(self, code: str) -> CodeAnalysis:
         """Analyze Python code"""
@@ -153,8 +215,38 @@ class PythonAnalyzer(ast.NodeVisitor):
             # Return empty analysis for invalid code
             return CodeAnalysis(language="python", line_count=code.count('\n') + 1)
             
-    def visit_FunctionDef(self, node: ast.FunctionDef):
-        """Visit function definition"""
+    def visit(self, tree: ast.AST, scope: str = ""):
+        """Collect symbols, imports and calls from a tree, in source order"""
+        dispatch = self._dispatch
+        expr = ast.expr
+        AST = ast.AST
+        
+        stack = [(tree, scope)]
+        push = stack.append
+        while stack:
+            node, scope = stack.pop()
+            
+            handler = dispatch.get(node.__class__)
+            if handler is not None:
+                scope = handler(node, scope)
+                if scope is None:
+                    continue
+            elif isinstance(node, expr):
+                self._walk_calls(node, scope)
+                continue
+                
+            # Push children in reverse so they pop in field order
+            for name in reversed(node._fields):
+                value = getattr(node, name, None)
+                if value.__class__ is list:
+                    for item in reversed(value):
+                        if isinstance(item, AST):
+                            push((item, scope))
+                elif isinstance(value, AST):
+                    push((value, scope))
+            
+    def visit_FunctionDef(self, node: ast.FunctionDef, scope: str) -> str:
+        """Visit (async) function definition"""
         # Build signature
         args = []
         for arg in node.args.args:
@@ -173,8 +265,7 @@ class PythonAnalyzer(ast.NodeVisitor):
         # Get decorators
         decorators = [ast.unparse(d) for d in node.decorator_list]
         
-        parent = self.current_scope[-1] if self.current_scope else ""
-        symbol_type = SymbolType.METHOD if parent else SymbolType.FUNCTION
+        symbol_type = SymbolType.METHOD if scope else SymbolType.FUNCTION
         
         self.symbols.append(CodeSymbol(
             name=node.name,
@@ -183,21 +274,14 @@ class PythonAnalyzer(ast.NodeVisitor):
             line_end=node.end_lineno or node.lineno,
             signature=signature,
             docstring=docstring[:200],
-            parent=parent,
+            parent=scope,
             decorators=decorators
         ))
         
         # Visit body with new scope
-        self.current_scope.append(node.name)
-        self.generic_visit(node)
-        self.current_scope.pop()
-        
-    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef):
-        """Visit async function definition"""
-        # Treat same as regular function
-        self.visit_FunctionDef(node)
+        return node.name
         
-    def visit_ClassDef(self, node: ast.ClassDef):
+    def visit_ClassDef(self, node: ast.ClassDef, scope: str) -> str:
         """Visit class definition"""
         bases = [ast.unparse(b) for b in node.bases]
         signature = f"class {node.name}"
@@ -214,16 +298,14 @@ class PythonAnalyzer(ast.NodeVisitor):
             line_end=node.end_lineno or node.lineno,
             signature=signature,
             docstring=docstring[:200],
-            parent=self.current_scope[-1] if self.current_scope else "",
+            parent=scope,
             decorators=decorators
         ))
         
         # Visit body with new scope
-        self.current_scope.append(node.name)
-        self.generic_visit(node)
-        self.current_scope.pop()
+        return node.name
         
-    def visit_Import(self, node: ast.Import):
+    def visit_Import(self, node: ast.Import, scope: str) -> None:
         """Visit import statement"""
         for alias in node.names:
             self.imports.append(ImportInfo(
@@ -234,7 +316,7 @@ class PythonAnalyzer(ast.NodeVisitor):
                 line=node.lineno
             ))
             
-    def visit_ImportFrom(self, node: ast.ImportFrom):
+    def visit_ImportFrom(self, node: ast.ImportFrom, scope: str) -> None:
         """Visit from...import statement"""
         module = node.module or ""
         names = [alias.name for alias in node.names]
@@ -246,33 +328,60 @@ class PythonAnalyzer(ast.NodeVisitor):
             line=node.lineno
         ))
         
-    def visit_Call(self, node: ast.Call):
-        """Visit function call"""
-        caller = self.current_scope[-1] if self.current_scope else "<module>"
+    def _walk_calls(self, node: ast.expr, scope: str):
+        """
+        Record every call in an expression subtree, in visit order.
         
-        # Get callee name
-        if isinstance(node.func, ast.Name):
-            callee = node.func.id
-            is_method = False
-        elif isinstance(node.func, ast.Attribute):
-            callee = node.func.attr
-            is_method = True
-        else:
-            callee = "<complex>"
-            is_method = False
-            
-        self.calls.append(CallInfo(
-            caller=caller,
-            callee=callee,
-            line=node.lineno,
-            is_method=is_method
-        ))
+        Expressions hold no definitions, imports or assignments, so the only
+        thing to collect below one is calls; walking the subtree with a
+        local stack avoids a visit() dispatch per Name/Constant/BinOp node.
+        """
+        caller = scope or "<module>"
+        calls = self.calls
+        Call, Name, Attribute = ast.Call, ast.Name, ast.Attribute
         
-        self.generic_visit(node)
+        stack = [node]
+        push = stack.append
+        while stack:
+            node = stack.pop()
+            cls = node.__class__
+            if cls in _CALL_FREE_LEAVES:
+                continue
+                
+            if cls is Call:
+                # Get callee name
+                func = node.func
+                if isinstance(func, Name):
+                    callee = func.id
+                    is_method = False
+                elif isinstance(func, Attribute):
+                    callee = func.attr
+                    is_method = True
+                else:
+                    callee = "<complex>"
+                    is_method = False
+                    
+                calls.append(CallInfo(
+                    caller=caller,
+                    callee=callee,
+                    line=node.lineno,
+                    is_method=is_method
+                ))
+                
+            # Push children in reverse so they pop in field order; contexts
+            # and operators (Load, Add, ...) can't hold calls and are skipped
+            for name in reversed(node._fields):
+                value = getattr(node, name, None)
+                if value.__class__ is list:
+                    for item in reversed(value):
+                        if isinstance(item, _EXPR_PARTS):
+                            push(item)
+                elif isinstance(value, _EXPR_PARTS):
+                    push(value)
         
-    def visit_Assign(self, node: ast.Assign):
+    def visit_Assign(self, node: ast.Assign, scope: str) -> str:
         """Visit assignment (module-level variables)"""
-        if not self.current_scope:  # Only module-level
+        if not scope:  # Only module-level
             for target in node.targets:
                 if isinstance(target, ast.Name):
                     # Check if it's a constant (ALL_CAPS)
@@ -285,14 +394,60 @@ class PythonAnalyzer(ast.NodeVisitor):
                         signature=f"{target.id} = ..."
                     ))
                     
-        self.generic_visit(node)
+        return scope
+
+
+def _line_regex(pattern: str) -> "re.Pattern[str]":
+    """
+    Compile a per-line pattern to run over a whole source: it cannot cross
+    a newline, and it swallows the rest of its line, so finditer() yields
+    exactly the first match on each line that has one.
+    """
+    return re.compile(pattern.replace(r'\s', r'[^\S\n]')
+                             .replace('[^}]', '[^}\\n]')
+                             .replace('[^\\\'"]', '[^\\\'"\\n]') + '.*')
+
+
+def _first_per_line(code: str, regexes: Tuple["re.Pattern[str]", ...]) -> Dict[int, "re.Match[str]"]:
+    """Map each line number to its match from the earliest regex that hits it"""
+    found = {}
+    for regex in regexes:
+        line, pos = 1, 0
+        for match in regex.finditer(code):
+            start = match.start()
+            line += code.count('\n', pos, start)
+            pos = start
+            found.setdefault(line, match)
+    return found
+
+
+# JavaScript function definitions, in priority order. The (?<!\w) guards
+# only skip starts inside a word, which can never be the leftmost match.
+_JS_FUNC_RES = tuple(map(_line_regex, (
+    r'function\s+(\w+)\s*\((.*?)\)',  # function name()
+    r'const\s+(\w+)\s*=\s*(?:async\s*)?\((.*?)\)\s*=>',  # const name = () =>
+    r'(?<!\w)(\w+)\s*:\s*(?:async\s*)?\((.*?)\)\s*=>',  # name: () =>
+    r'(?<!\w)(?:async\s+)?(\w+)\s*\((.*?)\)\s*{',  # method() {
+)))
+
+# JavaScript class definitions
+_JS_CLASS_RES = (
+    _line_regex(r'class\s+(\w+)(?:\s+extends\s+(\w+))?'),  # class A extends B
+)
+
+# JavaScript imports, in priority order
+_JS_IMPORT_RES = tuple(map(_line_regex, (
+    r'import\s+{([^}]+)}\s+from\s+[\'"]([^\'"]+)[\'"]',  # import { x } from 'y'
+    r'import\s+(\w+)\s+from\s+[\'"]([^\'"]+)[\'"]',  # import x from 'y'
+    r'const\s+{([^}]+)}\s*=\s*require\([\'"]([^\'"]+)[\'"]\)',  # const { x } = require('y')
+)))
 
 
 class JavaScriptAnalyzer:
     """Analyze JavaScript/TypeScript code using regex patterns"""
     
     def __init__(self):
-        self.encoder = Braille8Encoder()
+        self.encoder = _ENCODER
         
     def analyze(self, code: str) -> CodeAnalysis:
         """Analyze JavaScript code"""
@@ -300,47 +455,28 @@ class JavaScriptAnalyzer:
         imports = []
         calls = []
         
-        lines = code.split('\n')
-        
-        # Function patterns
-        func_patterns = [
-            r'function\s+(\w+)\s*\((.*?)\)',  # function name()
-            r'const\s+(\w+)\s*=\s*(?:async\s*)?\((.*?)\)\s*=>',  # const name = () =>
-            r'(\w+)\s*:\s*(?:async\s*)?\((.*?)\)\s*=>',  # name: () =>
-            r'(?:async\s+)?(\w+)\s*\((.*?)\)\s*{',  # method() {
-        ]
-        
-        # Class pattern
-        class_pattern = r'class\s+(\w+)(?:\s+extends\s+(\w+))?'
+        # One pass over the whole source per pattern, keeping the first
+        # match on each line
+        funcs = _first_per_line(code, _JS_FUNC_RES)
+        classes = _first_per_line(code, _JS_CLASS_RES)
         
-        # Import patterns
-        import_patterns = [
-            r'import\s+{([^}]+)}\s+from\s+[\'"]([^\'"]+)[\'"]',  # import { x } from 'y'
-            r'import\s+(\w+)\s+from\s+[\'"]([^\'"]+)[\'"]',  # import x from 'y'
-            r'const\s+{([^}]+)}\s*=\s*require\([\'"]([^\'"]+)[\'"]\)',  # const { x } = require('y')
-        ]
-        
-        for i, line in enumerate(lines, 1):
+        for i in sorted(funcs.keys() | classes.keys()):
             # Check for functions
-            for pattern in func_patterns:
-                match = re.search(pattern, line)
-                if match:
-                    name = match.group(1)
-                    params = match.group(2) if len(match.groups()) > 1 else ""
-                    symbols.append(CodeSymbol(
-                        name=name,
-                        type=SymbolType.FUNCTION,
-                        line_start=i,
-                        line_end=i,
-                        signature=f"{name}({params})"
-                    ))
-                    break
+            match = funcs.get(i)
+            if match:
+                name, params = match.groups()
+                symbols.append(CodeSymbol(
+                    name=name,
+                    type=SymbolType.FUNCTION,
+                    line_start=i,
+                    line_end=i,
+                    signature=f"{name}({params})"
+                ))
                     
             # Check for classes
-            match = re.search(class_pattern, line)
+            match = classes.get(i)
             if match:
-                name = match.group(1)
-                extends = match.group(2) if match.group(2) else ""
+                name, extends = match.groups()
                 sig = f"class {name}"
                 if extends:
                     sig += f" extends {extends}"
@@ -352,19 +488,15 @@ class JavaScriptAnalyzer:
                     signature=sig
                 ))
                 
-            # Check for imports
-            for pattern in import_patterns:
-                match = re.search(pattern, line)
-                if match:
-                    names = [n.strip() for n in match.group(1).split(',')]
-                    module = match.group(2)
-                    imports.append(ImportInfo(
-                        module=module,
-                        names=names,
-                        is_from=True,
-                        line=i
-                    ))
-                    break
+        # Check for imports
+        for i, match in sorted(_first_per_line(code, _JS_IMPORT_RES).items()):
+            names = [n.strip() for n in match.group(1).split(',')]
+            imports.append(ImportInfo(
+                module=match.group(2),
+                names=names,
+                is_from=True,
+                line=i
+            ))
                     
         # Extract dependencies
         dependencies = set()
@@ -380,7 +512,7 @@ class JavaScriptAnalyzer:
             imports=imports,
             calls=calls,
             dependencies=dependencies,
-            line_count=len(lines)
+            line_count=code.count('\n') + 1
         )
 
 
@@ -401,10 +533,79 @@ class CodeAnalyzerFactory:
             return PythonAnalyzer()
             
     @staticmethod
-    def analyze_code(code: str, language: str) -> CodeAnalysis:
-        """Analyze code for any supported language"""
+    def analyze_code(code: str, language: str, use_cache: bool = True) -> CodeAnalysis:
+        """
+        Analyze code for any supported language.
+        
+        Results are cached by SHA-256 of the source, first in memory and
+        then on disk under ANALYSIS_CACHE_DIR, so re-graphing an unchanged
+        file skips parsing entirely.
+        """
         analyzer = CodeAnalyzerFactory.get_analyzer(language)
-        return analyzer.analyze(code)
+        if not use_cache:
+            return analyzer.analyze(code)
+            
+        key = _analysis_key(code, analyzer)
+        cached = _load_analysis(key)
+        if cached is not None:
+            return cached
+            
+        analysis = analyzer.analyze(code)
+        _store_analysis(key, analysis)
+        return analysis
+
+
+def _analysis_key(code: str, analyzer) -> str:
+    """Cache key: source hash plus everything that shapes the result"""
+    digest = hashlib.sha256(code.encode('utf-8', 'surrogatepass')).hexdigest()
+    return (f"{digest}-{type(analyzer).__name__}-{__name__}"
+            f"-py{sys.version_info[0]}{sys.version_info[1]}-v{_ANALYSIS_CACHE_VERSION}")
+
+
+def _load_analysis(key: str) -> Optional[CodeAnalysis]:
+    """Cached analysis for key, from memory or disk; None on a miss"""
+    data = _analysis_memo.get(key)
+    if data is not None:
+        _analysis_memo.move_to_end(key)
+    else:
+        try:
+            data = (ANALYSIS_CACHE_DIR / f"{key}.pkl").read_bytes()
+        except OSError:
+            return None
+            
+    try:
+        analysis = pickle.loads(data)
+    except Exception:
+        # Corrupt or incompatible entry; recompute
+        return None
+    if not isinstance(analysis, CodeAnalysis):
+        return None
+        
+    _remember_analysis(key, data)
+    return analysis
+
+
+def _store_analysis(key: str, analysis: CodeAnalysis):
+    """Keep an analysis in memory and write it to the disk cache"""
+    data = pickle.dumps(analysis, protocol=pickle.HIGHEST_PROTOCOL)
+    _remember_analysis(key, data)
+    
+    path = ANALYSIS_CACHE_DIR / f"{key}.pkl"
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        ANALYSIS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+
+
+def _remember_analysis(key: str, data: bytes):
+    """Insert into the in-process LRU, evicting the oldest entry"""
+    _analysis_memo[key] = data
+    _analysis_memo.move_to_end(key)
+    if len(_analysis_memo) > _ANALYSIS_MEMO_SIZE:
+        _analysis_memo.popitem(last=False)
 
 
 def analyze_and_graph(code: str, language: str, file_id: str, 
@@ -425,13 +626,15 @@ def analyze_and_graph(code: str, language: str, file_id: str,
     # Analyze the code
     analysis = CodeAnalyzerFactory.analyze_code(code, language)
     
-    nodes_created = []
-    relationships_created = []
+    # Collected here and written in bulk below
+    nodes = []
+    rels = []
     
-    encoder = Braille8Encoder()
+    encoder = _ENCODER
+    braille_signatures = encoder.encode_batch([s.signature for s in analysis.symbols])
     
     # Create nodes for each symbol
-    for symbol in analysis.symbols:
+    for symbol, braille_signature in zip(analysis.symbols, braille_signatures):
         node_type = {
             SymbolType.FUNCTION: NodeType.FUNCTION,
             SymbolType.METHOD: NodeType.FUNCTION,
@@ -442,7 +645,7 @@ def analyze_and_graph(code: str, language: str, file_id: str,
         
         node_id = f"{file_id}::{symbol.name}"
         
-        node = Node(
+        nodes.append(Node(
             id=node_id,
             type=node_type,
             properties={
@@ -453,48 +656,33 @@ def analyze_and_graph(code: str, language: str, file_id: str,
                 "docstring": symbol.docstring,
                 "parent": symbol.parent,
                 "decorators": symbol.decorators,
-                "braille_signature": encoder.encode(symbol.signature)
+                "braille_signature": braille_signature
             }
-        )
+        ))
         
-        try:
-            graph_store.create_node(node)
-            nodes_created.append(node_id)
-            
-            # Create DEFINES relationship from file
-            rel = Relationship(
-                id=f"{file_id}-defines-{node_id}",
-                type=RelationType.DEFINES,
-                source_id=file_id,
+        # Create DEFINES relationship from file
+        rels.append(Relationship(
+            id=f"{file_id}-defines-{node_id}",
+            type=RelationType.DEFINES,
+            source_id=file_id,
+            target_id=node_id
+        ))
+        
+        # If method, create relationship to parent class
+        if symbol.parent:
+            parent_id = f"{file_id}::{symbol.parent}"
+            rels.append(Relationship(
+                id=f"{parent_id}-contains-{node_id}",
+                type=RelationType.CONTAINS,
+                source_id=parent_id,
                 target_id=node_id
-            )
-            graph_store.create_relationship(rel)
-            relationships_created.append(rel.id)
-            
-            # If method, create relationship to parent class
-            if symbol.parent:
-                parent_id = f"{file_id}::{symbol.parent}"
-                rel = Relationship(
-                    id=f"{parent_id}-contains-{node_id}",
-                    type=RelationType.CONTAINS,
-                    source_id=parent_id,
-                    target_id=node_id
-                )
-                try:
-                    graph_store.create_relationship(rel)
-                    relationships_created.append(rel.id)
-                except:
-                    pass
-                    
-        except Exception as e:
-            # Node might already exist
-            pass
+            ))
             
     # Create nodes for imports
     for imp in analysis.imports:
         import_id = f"{file_id}::import::{imp.module}"
         
-        node = Node(
+        nodes.append(Node(
             id=import_id,
             type=NodeType.IMPORT,
             properties={
@@ -503,25 +691,22 @@ def analyze_and_graph(code: str, language: str, file_id: str,
                 "is_from": imp.is_from,
                 "line": imp.line
             }
-        )
+        ))
         
-        try:
-            graph_store.create_node(node)
-            nodes_created.append(import_id)
-            
-            # Create IMPORTS relationship
-            rel = Relationship(
-                id=f"{file_id}-imports-{import_id}",
-                type=RelationType.IMPORTS,
-                source_id=file_id,
-                target_id=import_id,
-                properties={"names": imp.names}
-            )
-            graph_store.create_relationship(rel)
-            relationships_created.append(rel.id)
-            
-        except:
-            pass
+        # Create IMPORTS relationship
+        rels.append(Relationship(
+            id=f"{file_id}-imports-{import_id}",
+            type=RelationType.IMPORTS,
+            source_id=file_id,
+            target_id=import_id,
+            properties={"names": imp.names}
+        ))
+        
+    graph_store.create_nodes(nodes)
+    nodes_created = [node.id for node in nodes]
+    
+    # Symbols just graphed for this file; calls are only linked between these
+    local_ids = {f"{file_id}::{s.name}" for s in analysis.symbols}
             
     # Create CALLS relationships
     for call in analysis.calls:
@@ -529,22 +714,17 @@ def analyze_and_graph(code: str, language: str, file_id: str,
         callee_id = f"{file_id}::{call.callee}"
         
         # Only create if both exist (internal calls)
-        caller_exists = graph_store.get_node(caller_id)
-        callee_exists = graph_store.get_node(callee_id)
-        
-        if caller_exists and callee_exists:
-            rel = Relationship(
+        if caller_id in local_ids and callee_id in local_ids:
+            rels.append(Relationship(
                 id=f"{caller_id}-calls-{callee_id}-{call.line}",
                 type=RelationType.CALLS,
                 source_id=caller_id,
                 target_id=callee_id,
                 properties={"line": call.line}
-            )
-            try:
-                graph_store.create_relationship(rel)
-                relationships_created.append(rel.id)
-            except:
-                pass
+            ))
+            
+    # Relationships with a missing endpoint are skipped
+    relationships_created = [rel.id for rel in graph_store.create_relationships(rels)]
                 
     return {
         "analysis": analysis.to_dict(),
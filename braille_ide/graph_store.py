@@ -145,6 +145,10 @@ class GraphStore(ABC):
         """Create a node"""
         pass
         
+    def create_nodes(self, nodes: List[Node]) -> List[Node]:
+        """Create several nodes; stores override this to write in bulk"""
+        return [self.create_node(node) for node in nodes]
+        
     @abstractmethod
     def get_node(self, node_id: str) -> Optional[Node]:
         """Get a node by ID"""
@@ -165,6 +169,19 @@ class GraphStore(ABC):
         """Create a relationship"""
         pass
         
+    def create_relationships(self, rels: List[Relationship]) -> List[Relationship]:
+        """
+        Create several relationships, skipping any that cannot be created
+        (e.g. a missing endpoint). Returns the ones that were created.
+        """
+        created = []
+        for rel in rels:
+            try:
+                created.append(self.create_relationship(rel))
+            except Exception:
+                pass
+        return created
+        
     @abstractmethod
     def get_relationships(self, node_id: str, rel_type: RelationType = None, 
                           direction: str = "both") -> List[Relationship]:
@@ -277,26 +294,36 @@ class NetworkXSQLiteStore(GraphStore):
         
     def _save_node(self, node: Node):
         """Save node to SQLite"""
+        self._save_nodes([node])
+        
+    def _save_nodes(self, nodes: List[Node]):
+        """Save nodes to SQLite in one transaction"""
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         
-        cursor.execute('''
+        cursor.executemany('''
             INSERT OR REPLACE INTO nodes (id, type, properties, braille_id, updated_at)
             VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
-        ''', (node.id, node.type.value, json.dumps(node.properties), node.braille_id))
+        ''', [(node.id, node.type.value, json.dumps(node.properties), node.braille_id)
+              for node in nodes])
         
         conn.commit()
         conn.close()
         
     def _save_relationship(self, rel: Relationship):
         """Save relationship to SQLite"""
+        self._save_relationships([rel])
+        
+    def _save_relationships(self, rels: List[Relationship]):
+        """Save relationships to SQLite in one transaction"""
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         
-        cursor.execute('''
+        cursor.executemany('''
             INSERT OR REPLACE INTO relationships (id, type, source_id, target_id, properties)
             VALUES (?, ?, ?, ?, ?)
-        ''', (rel.id, rel.type.value, rel.source_id, rel.target_id, json.dumps(rel.properties)))
+        ''', [(rel.id, rel.type.value, rel.source_id, rel.target_id, json.dumps(rel.properties))
+              for rel in rels])
         
         conn.commit()
         conn.close()
@@ -310,6 +337,17 @@ class NetworkXSQLiteStore(GraphStore):
         self._save_node(node)
         return node
         
+    def create_nodes(self, nodes: List[Node]) -> List[Node]:
+        """Create several nodes with a single SQLite write"""
+        self.graph.add_nodes_from(
+            (node.id, {"type": node.type.value,
+                       "properties": node.properties,
+                       "braille_id": node.braille_id})
+            for node in nodes
+        )
+        self._save_nodes(nodes)
+        return nodes
+        
     def get_node(self, node_id: str) -> Optional[Node]:
         """Get a node by ID"""
         if node_id not in self.graph:
@@ -361,6 +399,21 @@ class NetworkXSQLiteStore(GraphStore):
         self._save_relationship(rel)
         return rel
         
+    def create_relationships(self, rels: List[Relationship]) -> List[Relationship]:
+        """
+        Create several relationships with a single SQLite write, skipping
+        any whose source or target node does not exist
+        """
+        created = [rel for rel in rels
+                   if rel.source_id in self.graph and rel.target_id in self.graph]
+        self.graph.add_edges_from(
+            (rel.source_id, rel.target_id,
+             {"id": rel.id, "type": rel.type.value, "properties": rel.properties})
+            for rel in created
+        )
+        self._save_relationships(created)
+        return created
+        
     def get_relationships(self, node_id: str, rel_type: RelationType = None,
                           direction: str = "both") -> List[Relationship]:
         """Get relationships for a node"""
@@ -542,6 +595,27 @@ class Neo4jStore(GraphStore):
                        properties=node.properties)
         return node
         
+    def create_nodes(self, nodes: List[Node]) -> List[Node]:
+        """Create several nodes with one query per type; existing ids are left as is"""
+        rows_by_type: Dict[NodeType, List[Dict]] = {}
+        for node in nodes:
+            rows_by_type.setdefault(node.type, []).append({
+                "id": node.id,
+                "braille_id": node.braille_id,
+                "properties": node.properties
+            })
+            
+        with self.driver.session() as session:
+            for node_type, rows in rows_by_type.items():
+                session.run(f"""
+                    UNWIND $rows AS row
+                    MERGE (n:{node_type.value} {{id: row.id}})
+                    ON CREATE SET n.braille_id = row.braille_id,
+                                  n.created_at = datetime(),
+                                  n += row.properties
+                """, rows=rows)
+        return nodes
+        
     def get_node(self, node_id: str) -> Optional[Node]:
         with self.driver.session() as session:
             result = session.run("""
@@ -601,6 +675,37 @@ class Neo4jStore(GraphStore):
                        rel_id=rel.id, properties=rel.properties)
         return rel
         
+    def create_relationships(self, rels: List[Relationship]) -> List[Relationship]:
+        """
+        Create several relationships with one query per type, skipping any
+        whose source or target node does not exist
+        """
+        rows_by_type: Dict[RelationType, List[Dict]] = {}
+        for rel in rels:
+            rows_by_type.setdefault(rel.type, []).append({
+                "id": rel.id,
+                "source_id": rel.source_id,
+                "target_id": rel.target_id,
+                "properties": rel.properties
+            })
+            
+        created_ids = set()
+        with self.driver.session() as session:
+            for rel_type, rows in rows_by_type.items():
+                result = session.run(f"""
+                    UNWIND $rows AS row
+                    MATCH (a {{id: row.source_id}})
+                    MATCH (b {{id: row.target_id}})
+                    CREATE (a)-[r:{rel_type.value} {{
+                        id: row.id,
+                        created_at: datetime()
+                    }}]->(b)
+                    SET r += row.properties
+                    RETURN row.id AS id
+                """, rows=rows)
+                created_ids.update(record["id"] for record in result)
+        return [rel for rel in rels if rel.id in created_ids]
+        
     def get_relationships(self, node_id: str, rel_type: RelationType = None,
                           direction: str = "both") -> List[Relationship]:
         with self.driver.session() as session: